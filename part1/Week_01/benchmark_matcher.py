@@ -0,0 +1,72 @@
+# benchmark_matcher.py
+# 키워드 규칙 개수(1, 10, 100개)에 따른 analyze_logs 처리 속도(lines/sec)를 측정하는 스크립트
+
+import random
+import string
+import time
+
+from main import analyze_logs, compile_rules
+
+LINE_COUNT = 200000
+RULE_COUNTS = (1, 10, 100)
+EVENTS = ('INFO', 'WARNING', 'ERROR')
+
+
+def make_keyword(rng):
+    return ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(5, 12)))
+
+
+def make_lines(count, rng):
+    # 기존 로그와 같은 'timestamp,event,message' 형식의 가짜 로그 생성
+    words = [make_keyword(rng) for _ in range(500)]
+    lines = []
+    for i in range(count):
+        message = ' '.join(rng.choice(words) for _ in range(8))
+        lines.append(f'2023-08-27 10:{i // 60 % 60:02d}:{i % 60:02d},{rng.choice(EVENTS)},{message}.\n')
+    return lines
+
+
+def make_rules(count, rng):
+    # 첫 규칙은 기존 'ERROR' 규칙, 나머지는 대소문자 무시 키워드
+    rules = [('ERROR', False)]
+    while len(rules) < count:
+        rules.append((make_keyword(rng), True))
+    return rules
+
+
+def naive_matcher(rules):
+    # 비교용: 기존 방식처럼 키워드마다 'in' 검사와 lower()를 반복
+    def match(line):
+        for keyword, ignore_case in rules:
+            if (keyword.lower() in line.lower()) if ignore_case else (keyword in line):
+                return True
+        return False
+    return match
+
+
+def measure(lines, matcher):
+    start = time.perf_counter()
+    matched = sum(1 for _ in analyze_logs(lines, matcher))
+    elapsed = time.perf_counter() - start
+    return len(lines) / elapsed, matched
+
+
+def run_benchmark(lines, rule_count, rng):
+    rules = make_rules(rule_count, rng)
+    compiled, matched = measure(lines, compile_rules(rules))
+    naive, _ = measure(lines, naive_matcher(rules))
+    return compiled, naive, matched
+
+
+def main():
+    rng = random.Random(0)
+    lines = make_lines(LINE_COUNT, rng)
+    print(f'로그 {LINE_COUNT}줄 기준')
+    for rule_count in RULE_COUNTS:
+        compiled, naive, matched = run_benchmark(lines, rule_count, rng)
+        print(f'키워드 {rule_count:>3}개: compiled {compiled:>12,.0f} lines/sec | '
+              f'naive {naive:>12,.0f} lines/sec (매치 {matched}줄)')
+
+
+if __name__ == '__main__':
+    main()
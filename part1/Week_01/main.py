@@ -1,6 +1,22 @@
 # main.py
 
+import argparse
+import json
 import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+CHUNK_SIZE = 64 * 1024  # 역순 읽기 시 한 번에 읽을 바이트 수
+RANGE_SIZE = 8 * 1024 * 1024  # 병렬 분석 시 작업 하나가 맡는 최대 바이트 수
+FOLLOW_INTERVAL = 1.0  # --follow 모드에서 새 로그를 확인하는 간격 (초)
+
+# 중요 로그로 뽑아낼 키워드 규칙: (키워드, 대소문자 무시 여부)
+DEFAULT_RULES = [
+    ('ERROR', False),
+    ('explosion', True),
+]
 
 def check_python():
     # 파이썬이 정상적으로 실행되는지 확인하는 코드
@@ -11,58 +27,348 @@ def get_log_filepath():
     current_dir = os.path.dirname(os.path.abspath(__file__))
     return os.path.join(current_dir, 'mission_computer_main.log')
 
+def get_rules_filepath():
+    # 키워드 규칙 파일도 main.py가 있는 폴더에서 찾도록 설정
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(current_dir, 'log_rules.txt')
+
 def get_report_filepath():
     # 분석 결과 파일을 main.py가 있는 폴더에 저장하도록 설정
     current_dir = os.path.dirname(os.path.abspath(__file__))
     return os.path.join(current_dir, 'log_analysis.md')
 
 def read_log_file(filename):
-    # 로그 파일을 읽어오는 함수
+    # 로그 파일을 한 줄씩 넘겨주는 제너레이터 (파일 전체를 메모리에 올리지 않음)
     try:
         with open(filename, 'r', encoding='utf-8') as file:
-            lines = file.readlines()
-            return lines
+            for line in file:
+                yield line
+    except FileNotFoundError:
+        print(f"오류: 파일 '{filename}'을 찾을 수 없습니다.")
+    except Exception as e:
+        print(f"오류 발생: {e}")
+
+def read_log_file_reversed(filename, chunk_size=CHUNK_SIZE):
+    # 파일 끝에서부터 chunk_size 만큼 거꾸로 읽으면서 최신 로그부터 한 줄씩 넘겨줌
+    # 한 번에 메모리에 올라가는 양은 청크 하나 + 잘린 줄 하나 뿐임
+    try:
+        with open(filename, 'rb') as file:
+            file.seek(0, os.SEEK_END)
+            position = file.tell()
+            remainder = b''
+            is_last_line = True
+            while position > 0:
+                read_size = min(chunk_size, position)
+                position -= read_size
+                file.seek(position)
+                chunk = file.read(read_size) + remainder
+                parts = chunk.split(b'\n')
+                # 맨 앞 조각은 이전 청크와 이어질 수 있으므로 다음 반복으로 넘김
+                remainder = parts[0]
+                for part in reversed(parts[1:]):
+                    if is_last_line:
+                        is_last_line = False
+                        if not part:
+                            continue  # 파일 끝의 개행 문자 뒤 빈 줄은 건너뜀
+                    yield part.decode('utf-8') + '\n'
+            if remainder or not is_last_line:
+                yield remainder.decode('utf-8') + '\n'
     except FileNotFoundError:
         print(f"오류: 파일 '{filename}'을 찾을 수 없습니다.")
-        return []
     except Exception as e:
         print(f"오류 발생: {e}")
-        return []
 
-def write_analysis_report(filename, content):
-    # 분석 결과를 Markdown 파일로 저장하는 함수
+def get_state_filepath(log_filepath):
+    # 증분 분석 상태(마지막으로 읽은 위치)는 로그 파일 옆에 '.state' 파일로 저장
+    return log_filepath + '.state'
+
+def load_offset_state(filename):
+    # 저장된 {'inode': ..., 'offset': ...} 상태를 읽어오는 함수, 없으면 None
+    try:
+        with open(filename, 'r', encoding='utf-8') as file:
+            state = json.load(file)
+        return {'inode': int(state['inode']), 'offset': int(state['offset'])}
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"상태 파일 읽기 중 오류 발생: {e}")
+        return None
+
+def save_offset_state(filename, inode, offset):
+    # 임시 파일에 먼저 쓰고 교체해서 중간에 종료되어도 상태 파일이 깨지지 않도록 함
+    temp_filename = filename + '.tmp'
     try:
-        with open(filename, 'w', encoding='utf-8') as file:
-            file.write(content)
+        with open(temp_filename, 'w', encoding='utf-8') as file:
+            json.dump({'inode': inode, 'offset': offset}, file)
+        os.replace(temp_filename, filename)
+    except Exception as e:
+        print(f"상태 파일 저장 중 오류 발생: {e}")
+
+def read_new_lines(filename, offset):
+    # offset 바이트부터 새로 추가된 '완성된' 줄을 (줄, 그 줄 다음 위치) 형태로 넘겨주는 제너레이터
+    # 아직 개행 문자가 없는 마지막 줄은 기록 중일 수 있으므로 다음 실행으로 미룸
+    with open(filename, 'rb') as file:
+        file.seek(offset)
+        for raw_line in file:
+            if not raw_line.endswith(b'\n'):
+                break
+            offset += len(raw_line)
+            # UTF-8이 아닌 바이트가 섞여 있어도 멈추지 않도록 대체 문자로 바꿔서 읽음
+            # 순차 분석(텍스트 모드)과 같도록 '\r\n'은 '\n'으로 바꿈
+            yield raw_line.decode('utf-8', errors='replace').replace('\r\n', '\n'), offset
+
+def analyze_new_logs(log_filepath, report_filepath, state_filepath, matcher):
+    # 마지막 실행 이후 추가된 로그만 분석해서 보고서 뒤에 덧붙이고 상태를 저장하는 함수
+    # 로그 교체(inode 변경)나 파일이 잘린 경우(크기 < 저장된 위치)는 처음부터 다시 읽음
+    stat = os.stat(log_filepath)
+    state = load_offset_state(state_filepath)
+    offset = 0
+    mode = 'w'
+    if state is not None:
+        if state['inode'] != stat.st_ino or stat.st_size < state['offset']:
+            print("로그 파일이 교체된 것을 감지했습니다. 처음부터 다시 분석합니다.")
+        else:
+            offset = state['offset']
+        mode = 'a'
+    if state is not None and offset == stat.st_size:
+        return 0  # 새로 추가된 로그가 없음
+
+    new_lines = read_new_lines(log_filepath, offset)
+    end_offset = offset
+
+    def track_offset():
+        # 다음 줄을 요청받았다는 것은 앞 줄의 분석과 보고서 기록이 끝났다는 뜻이므로 그때 위치를 갱신
+        # 중간에 오류가 나도 실제로 처리한 줄까지만 저장되어 다음 실행에서 같은 줄이 중복 기록되지 않음
+        nonlocal end_offset
+        for line, line_end in new_lines:
+            yield line
+            end_offset = line_end
+
+    count = write_analysis_report(report_filepath, print_lines(analyze_logs(track_offset(), matcher)), mode)
+    save_offset_state(state_filepath, stat.st_ino, end_offset)
+    return count
+
+def follow_logs(log_filepath, report_filepath, state_filepath, matcher, interval=FOLLOW_INTERVAL):
+    # interval 초마다 새로 추가된 로그를 확인하는 tail 루프 (Ctrl+C로 종료)
+    print(f"로그를 계속 감시합니다. ({interval}초 간격, Ctrl+C로 종료)")
+    try:
+        while True:
+            try:
+                analyze_new_logs(log_filepath, report_filepath, state_filepath, matcher)
+            except FileNotFoundError:
+                pass  # 로그 교체(rotation) 중이라 잠시 파일이 없으면 다음 확인 때 다시 시도
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        print("\n로그 감시를 종료합니다.")
+
+def write_analysis_report(filename, lines, mode='w'):
+    # 분석 결과를 Markdown 파일로 한 줄씩 바로 저장하고, 저장한 줄 수를 반환하는 함수
+    # 결과가 하나도 없으면 파일을 만들지 않음 (mode='a'이면 기존 보고서 뒤에 덧붙임)
+    count = 0
+    file = None
+    try:
+        for line in lines:
+            if file is None:
+                file = open(filename, mode, encoding='utf-8')
+            file.write(line if line.endswith('\n') else line + '\n')
+            count += 1
     except Exception as e:
         print(f"보고서 저장 중 오류 발생: {e}")
+    finally:
+        if file is not None:
+            file.close()
+    return count
+
+def load_rules(filename):
+    # 규칙 파일을 읽어 (키워드, 대소문자 무시 여부) 리스트로 반환하는 함수
+    # 한 줄에 규칙 하나, 'explosion,i' 처럼 ',i'를 붙이면 대소문자를 무시함
+    # 파일이 없으면 기본 규칙(DEFAULT_RULES)을 사용
+    rules = []
+    try:
+        with open(filename, 'r', encoding='utf-8') as file:
+            for line in file:
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                keyword, _, flag = line.rpartition(',')
+                if keyword and flag.strip().lower() == 'i':
+                    rules.append((keyword, True))
+                else:
+                    rules.append((line, False))
+    except FileNotFoundError:
+        return list(DEFAULT_RULES)
+    except Exception as e:
+        print(f"규칙 파일 읽기 중 오류 발생: {e}")
+        return list(DEFAULT_RULES)
+    return rules
+
+def build_trie_pattern(keywords):
+    # 키워드들을 접두사 트리(trie) 형태의 정규식으로 만드는 함수
+    # 'abc|abd' 대신 'ab(?:c|d)' 처럼 공통 접두사를 묶어서 키워드가 많아도 위치마다 한 번만 비교함
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}  # 키워드 끝 표시
+
+    def to_pattern(node):
+        ends_here = '' in node
+        branches = [re.escape(char) + to_pattern(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if ends_here:
+            # 여기서 끝나는 짧은 키워드도 매치되도록 나머지를 선택적으로 만듦
+            return (body if len(branches) > 1 else '(?:' + body + ')') + '?'
+        return body
+
+    return to_pattern(trie)
 
-def analyze_logs(lines):
-    # 로그 파일에서 'ERROR' 또는 'explosion'이 포함된 중요한 로그만 추출하는 함수
-    error_logs = [line for line in lines if 'ERROR' in line or 'explosion' in line.lower()]
-    return error_logs
+def compile_keywords(keywords):
+    # 키워드 묶음 하나를 검사 함수로 만드는 함수
+    # 키워드가 하나뿐이면 정규식보다 'in' 연산이 훨씬 빠르므로 그대로 사용
+    if not keywords:
+        return None
+    if len(keywords) == 1:
+        keyword = keywords[0]
+        return lambda line: keyword in line
+    return re.compile(build_trie_pattern(keywords)).search
+
+def compile_rules(rules):
+    # 모든 키워드 규칙을 미리 컴파일해서 한 줄을 검사하는 함수(matcher)를 만들어 반환
+    # 대소문자를 구분하는 키워드끼리, 무시하는 키워드끼리 각각 trie 정규식 하나로 묶음
+    # 파이썬 re의 IGNORECASE는 키워드가 많을수록 크게 느려지므로,
+    # 대소문자 무시 키워드는 소문자로 컴파일해두고 줄마다 lower()를 한 번만 해서 검사함
+    # (기존처럼 키워드마다 lower()를 하지 않음)
+    case_sensitive = [keyword for keyword, ignore_case in rules if keyword and not ignore_case]
+    ignore_case = [keyword.lower() for keyword, ignore_case in rules if keyword and ignore_case]
+    search = compile_keywords(case_sensitive)
+    search_lower = compile_keywords(ignore_case)
+
+    if search and search_lower:
+        return lambda line: bool(search(line) or search_lower(line.lower()))
+    if search:
+        return lambda line: bool(search(line))
+    if search_lower:
+        return lambda line: bool(search_lower(line.lower()))
+    return lambda line: False  # 규칙이 없으면 아무것도 매치하지 않음
+
+def analyze_logs(lines, matcher=None):
+    # 로그에서 키워드 규칙에 맞는 중요한 로그만 하나씩 넘겨주는 제너레이터
+    # matcher를 넘기지 않으면 기본 규칙('ERROR', 'explosion')을 사용
+    if matcher is None:
+        matcher = compile_rules(DEFAULT_RULES)
+    for line in lines:
+        if matcher(line):
+            yield line
+
+def split_byte_ranges(filename, workers, range_size=RANGE_SIZE):
+    # 파일을 줄 단위 경계에 맞춘 (시작, 끝) 바이트 구간 리스트로 나누는 함수
+    # 작업이 고르게 분배되도록 워커 수의 4배 이상으로 나누고, 구간 하나는 range_size를 넘지 않게 함
+    file_size = os.path.getsize(filename)
+    if file_size == 0:
+        return []
+    count = max(workers * 4, -(-file_size // range_size))
+    step = max(1, -(-file_size // count))
+    ranges = []
+    with open(filename, 'rb') as file:
+        start = 0
+        while start < file_size:
+            end = start + step
+            if end >= file_size:
+                end = file_size
+            else:
+                # 구간 끝을 다음 개행 문자 바로 뒤로 옮겨서 줄이 잘리지 않도록 함
+                file.seek(end - 1)
+                file.readline()
+                end = file.tell()
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+def scan_byte_range(filename, start, end, rules):
+    # 워커 프로세스에서 실행: 바이트 구간 하나를 읽어 규칙에 맞는 줄 리스트를 반환
+    # matcher(lambda)는 프로세스로 넘길 수 없으므로 규칙을 받아서 워커에서 컴파일함
+    matcher = compile_rules(rules)
+    with open(filename, 'rb') as file:
+        file.seek(start)
+        data = file.read(end - start)
+    # 순차 분석(텍스트 모드)과 결과가 같도록 '\r\n', '\r'도 '\n'으로 바꿔서 줄을 나눔
+    text = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+    lines = text.split('\n')
+    last = lines.pop()
+    matches = [line + '\n' for line in lines if matcher(line + '\n')]
+    if last and matcher(last):
+        matches.append(last)
+    return matches
+
+def analyze_logs_parallel(filename, rules, workers):
+    # 파일을 바이트 구간으로 나눠 여러 프로세스에서 동시에 분석하는 제너레이터
+    # executor.map은 제출한 순서대로 결과를 돌려주므로 파일 순서 그대로 넘겨줌
+    ranges = split_byte_ranges(filename, workers)
+    if not ranges:
+        return
+    starts = [start for start, _ in ranges]
+    ends = [end for _, end in ranges]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for matches in executor.map(scan_byte_range, repeat(filename), starts, ends, repeat(rules)):
+            yield from matches
+
+def print_lines(lines):
+    # 넘겨받은 줄을 화면에 출력하면서 그대로 다음 단계로 넘겨줌
+    for line in lines:
+        print(line.strip())
+        yield line
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='미션 컴퓨터 로그 분석기')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='분석에 사용할 프로세스 수 (1이면 순차 분석, 0이면 CPU 코어 수)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='지난 실행 이후 추가된 로그만 분석해서 보고서에 덧붙임')
+    parser.add_argument('--follow', action='store_true',
+                        help='새로 추가되는 로그를 계속 감시하면서 분석 (tail -f 방식)')
+    parser.add_argument('--interval', type=float, default=FOLLOW_INTERVAL,
+                        help='--follow 모드에서 새 로그를 확인하는 간격 (초)')
+    return parser.parse_args()
 
 def main():
+    args = parse_args()
+    workers = args.workers or os.cpu_count() or 1
     check_python()
     
     log_filepath = get_log_filepath()  # 올바른 로그 파일 경로 가져오기
     report_filepath = get_report_filepath()  # 올바른 보고서 파일 경로 가져오기
     
-    logs = read_log_file(log_filepath)
-    if not logs:
+    if not os.path.isfile(log_filepath):
+        print(f"오류: 파일 '{log_filepath}'을 찾을 수 없습니다.")
         return  # 로그 파일이 없으면 프로그램 종료
     
+    if args.incremental or args.follow:
+        # 증분 모드에서는 전체 로그를 다시 읽지 않고 새로 추가된 줄만 분석함
+        matcher = compile_rules(load_rules(get_rules_filepath()))
+        state_filepath = get_state_filepath(log_filepath)
+        if args.follow:
+            follow_logs(log_filepath, report_filepath, state_filepath, matcher, args.interval)
+        else:
+            count = analyze_new_logs(log_filepath, report_filepath, state_filepath, matcher)
+            print(f"새로 찾은 주요 로그 {count}건을 [{report_filepath}]에 추가했습니다.")
+        return
+    
     print("--- 로그 내용 (시간의 역순, 최신 순서) ---")
-    for log in logs[::-1]:  # 최신 로그가 먼저 출력되도록 역순 정렬
+    for log in read_log_file_reversed(log_filepath):  # 파일 끝에서부터 읽어서 최신 로그가 먼저 출력됨
         print(log.strip())
     
-    error_logs = analyze_logs(logs)
-    if error_logs:
-        print("\n--- 주요 오류 로그 ---")
-        for error in error_logs:
-            print(error.strip())
-        
-        write_analysis_report(report_filepath, "\n".join(error_logs))
+    rules = load_rules(get_rules_filepath())
+    print("\n--- 주요 오류 로그 ---")
+    if workers > 1:
+        error_logs = analyze_logs_parallel(log_filepath, rules, workers)
+    else:
+        matcher = compile_rules(rules)  # 규칙은 한 번만 컴파일
+        error_logs = analyze_logs(read_log_file(log_filepath), matcher)
+    count = write_analysis_report(report_filepath, print_lines(error_logs))
+    if count:
         print(f"분석 보고서가 [{report_filepath}]에 저장되었습니다.")
     else:
         print("로그에서 중요한 오류를 찾을 수 없습니다.")
@@ -0,0 +1,169 @@
+# inventory_binary.py
+# 인벤토리 목록을 저장하는 이진 파일 형식 (Mars_Base_Inventory_List.bin)
+#
+# 파일 구조 (모든 숫자는 little-endian)
+#   [헤더]     magic 'MINV' | 버전(H) | 필드 수(H) | 행 수(Q) | 행 크기(I) | 행 시작 위치(Q) | 문자열 표 시작 위치(Q)
+#   [스키마]   필드마다: 타입 코드 1바이트('s' 문자열, 'd' 실수) | 이름 길이(H) | 이름(UTF-8)
+#   [행]       행 수 x 고정 크기 레코드. 문자열 필드는 문자열 표 번호(I), 실수 필드는 float64(d)
+#   [문자열 표] 문자열 수(I) | 시작 위치 배열((문자열 수 + 1) x Q) | UTF-8 바이트
+#
+# 행이 고정 크기이므로 mmap으로 열어서 i번째 행을 파일 전체를 읽지 않고 바로 꺼낼 수 있음
+# 같은 문자열('Various' 등)은 문자열 표에 한 번만 저장됨
+
+import mmap
+import struct
+
+MAGIC = b'MINV'
+VERSION = 1
+HEADER_FORMAT = '<4sHHQIQQ'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+FIELD_FORMATS = {'s': 'I', 'd': 'd'}
+
+# (이름, 타입 코드): CSV 원본 문자열은 그대로 보존하고, 숫자 값은 float64로 함께 저장 (숫자가 아니면 NaN)
+SCHEMA = [
+    ('Substance', 's'),
+    ('Weight', 's'),
+    ('Specific Gravity', 's'),
+    ('Strength', 's'),
+    ('Flammability', 'd'),
+    ('Weight Value', 'd'),
+    ('Specific Gravity Value', 'd'),
+]
+
+
+def to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float('nan')
+
+
+def get_row_format(schema):
+    return '<' + ''.join(FIELD_FORMATS[kind] for _, kind in schema)
+
+
+def pack_schema(schema):
+    data = b''
+    for name, kind in schema:
+        encoded = name.encode('utf-8')
+        data += kind.encode('ascii') + struct.pack('<H', len(encoded)) + encoded
+    return data
+
+
+def write_inventory_binary(filename, inventory):
+    # inventory: InventoryTable.to_records() 형식의 딕셔너리 리스트
+    strings = []
+    string_ids = {}
+
+    def intern(text):
+        text = str(text)
+        if text not in string_ids:
+            string_ids[text] = len(strings)
+            strings.append(text)
+        return string_ids[text]
+
+    row_struct = struct.Struct(get_row_format(SCHEMA))
+    rows = bytearray()
+    for item in inventory:
+        values = {
+            'Weight Value': to_float(item['Weight']),
+            'Specific Gravity Value': to_float(item['Specific Gravity']),
+        }
+        packed = []
+        for name, kind in SCHEMA:
+            value = values[name] if name in values else item[name]
+            packed.append(intern(value) if kind == 's' else float(value))
+        rows += row_struct.pack(*packed)
+
+    encoded_strings = [text.encode('utf-8') for text in strings]
+    offsets = [0]
+    for encoded in encoded_strings:
+        offsets.append(offsets[-1] + len(encoded))
+    string_table = (struct.pack('<I', len(strings)) + struct.pack(f'<{len(offsets)}Q', *offsets)
+                    + b''.join(encoded_strings))
+
+    schema_bytes = pack_schema(SCHEMA)
+    rows_offset = HEADER_SIZE + len(schema_bytes)
+    strings_offset = rows_offset + len(rows)
+    header = struct.pack(HEADER_FORMAT, MAGIC, VERSION, len(SCHEMA), len(inventory),
+                         row_struct.size, rows_offset, strings_offset)
+    with open(filename, 'wb') as file:
+        file.write(header)
+        file.write(schema_bytes)
+        file.write(rows)
+        file.write(string_table)
+
+
+class InventoryBinaryReader:
+    # mmap으로 이진 파일을 열고, 필요한 행만 그때그때 풀어서 읽는 클래스
+    def __init__(self, filename):
+        self.file = open(filename, 'rb')
+        try:
+            self.mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self.file.close()
+            raise ValueError('빈 파일은 인벤토리 이진 파일이 아닙니다.')
+        try:
+            self._read_header()
+        except Exception:
+            self.close()
+            raise
+
+    def _read_header(self):
+        (magic, version, field_count, self.row_count, self.row_size,
+         self.rows_offset, self.strings_offset) = struct.unpack_from(HEADER_FORMAT, self.mm, 0)
+        if magic != MAGIC:
+            raise ValueError('인벤토리 이진 파일 형식이 아닙니다.')
+        if version != VERSION:
+            raise ValueError(f'지원하지 않는 버전입니다: {version}')
+
+        self.schema = []
+        position = HEADER_SIZE
+        for _ in range(field_count):
+            kind = self.mm[position:position + 1].decode('ascii')
+            (length,) = struct.unpack_from('<H', self.mm, position + 1)
+            name = self.mm[position + 3:position + 3 + length].decode('utf-8')
+            self.schema.append((name, kind))
+            position += 3 + length
+
+        self.row_struct = struct.Struct(get_row_format(self.schema))
+        if self.row_struct.size != self.row_size:
+            raise ValueError('스키마와 행 크기가 일치하지 않습니다.')
+        (self.string_count,) = struct.unpack_from('<I', self.mm, self.strings_offset)
+        self.string_offsets_position = self.strings_offset + 4
+        self.string_data_position = self.string_offsets_position + 8 * (self.string_count + 1)
+
+    def __len__(self):
+        return self.row_count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        if getattr(self, 'mm', None) is not None:
+            self.mm.close()
+            self.mm = None
+        self.file.close()
+
+    def get_string(self, string_id):
+        start, end = struct.unpack_from('<QQ', self.mm, self.string_offsets_position + 8 * string_id)
+        return self.mm[self.string_data_position + start:self.string_data_position + end].decode('utf-8')
+
+    def get_row(self, index):
+        # index번째 행을 딕셔너리로 반환 (파일 전체를 읽지 않음)
+        if index < 0:
+            index += self.row_count
+        if not 0 <= index < self.row_count:
+            raise IndexError('행 번호가 범위를 벗어났습니다.')
+        values = self.row_struct.unpack_from(self.mm, self.rows_offset + index * self.row_size)
+        return {
+            name: self.get_string(value) if kind == 's' else value
+            for (name, kind), value in zip(self.schema, values)
+        }
+
+    def __iter__(self):
+        for index in range(self.row_count):
+            yield self.get_row(index)
@@ -0,0 +1,107 @@
+# inventory_cache.py
+# 파싱한 인벤토리 열(column)들을 .npy 파일로 저장해두고, 다음 실행 때 mmap으로 바로 불러오는 캐시
+# 원본 CSV의 경로/크기/수정 시각이 바뀌면 자동으로 다시 파싱해서 캐시를 새로 만듦
+# 캐시를 새로 만들 때는 새 데이터 폴더(data-*)에 쓰고 meta.json만 교체함
+# → 이미 mmap으로 열려 있는 이전 .npy 파일을 덮어쓰지(잘라내지) 않으므로 읽던 쪽이 죽지 않음
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from inventory_loader import load_inventory
+from inventory_table import InventoryTable
+
+CACHE_DIR_NAME = '.inventory_cache'
+META_FILE_NAME = 'meta.json'
+CACHE_VERSION = 2
+DATA_DIR_PREFIX = 'data-'
+
+
+def get_cache_dir(source_path):
+    # 원본 CSV 옆의 .inventory_cache 폴더 아래에 '파일 이름-절대 경로 해시' 폴더를 사용
+    source_path = os.path.abspath(source_path)
+    digest = hashlib.sha1(source_path.encode('utf-8')).hexdigest()[:12]
+    name = os.path.splitext(os.path.basename(source_path))[0]
+    return os.path.join(os.path.dirname(source_path), CACHE_DIR_NAME, f'{name}-{digest}')
+
+
+def get_source_key(source_path):
+    stat = os.stat(source_path)
+    return {
+        'version': CACHE_VERSION,
+        'source_path': os.path.abspath(source_path),
+        'source_size': stat.st_size,
+        'source_mtime_ns': stat.st_mtime_ns,
+    }
+
+
+def load_cached_table(cache_dir, source_key):
+    # 캐시가 원본과 일치하면 열들을 mmap으로 열어서 테이블을 반환, 아니면 None
+    try:
+        with open(os.path.join(cache_dir, META_FILE_NAME), 'r', encoding='utf-8') as file:
+            meta = json.load(file)
+    except (FileNotFoundError, ValueError):
+        return None
+    if any(meta.get(key) != value for key, value in source_key.items()):
+        return None
+
+    data_dir = os.path.join(cache_dir, meta['data_dir'])
+    table = InventoryTable.__new__(InventoryTable)
+    for name in meta['columns']:
+        path = os.path.join(data_dir, name + '.npy')
+        # 빈 배열은 mmap할 수 없으므로 그대로 읽음
+        mmap_mode = 'r' if meta['rows'] else None
+        setattr(table, name, np.load(path, mmap_mode=mmap_mode))
+    return table
+
+
+def save_cached_table(cache_dir, source_key, table):
+    # 새 데이터 폴더에 열마다 .npy 파일을 쓰고, 마지막에 meta.json을 교체해서 새 폴더를 가리키게 함
+    # 중간에 실패해도 깨진 캐시를 쓰지 않고, 이전 캐시를 mmap으로 읽고 있는 쪽도 영향을 받지 않음
+    os.makedirs(cache_dir, exist_ok=True)
+    data_dir = tempfile.mkdtemp(prefix=DATA_DIR_PREFIX, dir=cache_dir)
+    columns = list(vars(table))
+    for name in columns:
+        np.save(os.path.join(data_dir, name + '.npy'), np.ascontiguousarray(getattr(table, name)))
+    meta = dict(source_key, columns=columns, rows=len(table), data_dir=os.path.basename(data_dir))
+    temp_path = os.path.join(cache_dir, META_FILE_NAME + '.tmp')
+    with open(temp_path, 'w', encoding='utf-8') as file:
+        json.dump(meta, file, ensure_ascii=False)
+    os.replace(temp_path, os.path.join(cache_dir, META_FILE_NAME))
+    remove_old_data_dirs(cache_dir, os.path.basename(data_dir))
+
+
+def remove_old_data_dirs(cache_dir, current):
+    # 이전 데이터 폴더 정리: 리눅스/맥은 mmap 중인 파일을 지워도 읽던 쪽은 그대로 쓸 수 있음
+    # 윈도우처럼 열려 있는 파일을 지울 수 없으면 남겨두고 다음에 다시 정리
+    for name in os.listdir(cache_dir):
+        if name.startswith(DATA_DIR_PREFIX) and name != current:
+            shutil.rmtree(os.path.join(cache_dir, name), ignore_errors=True)
+
+
+def load_inventory_cached(source_path, workers=None):
+    # 캐시가 유효하면 mmap으로 바로 불러오고, 없거나 원본이 바뀌었으면 CSV를 파싱해서 캐시를 만듦
+    try:
+        source_key = get_source_key(source_path)
+    except FileNotFoundError:
+        print('파일을 찾을 수 없습니다:', source_path)
+        return None
+    cache_dir = get_cache_dir(source_path)
+    try:
+        table = load_cached_table(cache_dir, source_key)
+        if table is not None:
+            return table
+    except Exception as e:
+        print('캐시 읽기 중 오류 발생, 다시 파싱합니다:', e)
+
+    table = load_inventory(source_path, workers)
+    if table is not None:
+        try:
+            save_cached_table(cache_dir, source_key, table)
+        except Exception as e:
+            print('캐시 저장 중 오류 발생:', e)
+    return table
@@ -0,0 +1,84 @@
+# inventory_loader.py
+# 큰 인벤토리 CSV를 행 경계에 맞춰 여러 조각으로 나누고, 조각마다 다른 프로세스에서 파싱하는 모듈
+# 물질 이름에 쉼표가 들어간 경우("Sodium, metallic" 처럼 따옴표로 감싼 필드)도 csv 모듈로 올바르게 처리함
+
+import csv
+import io
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import numpy as np
+
+from inventory_table import COLUMNS, InventoryTable
+
+CHUNK_SIZE = 16 * 1024 * 1024  # 조각 하나의 대략적인 크기 (바이트)
+
+
+def find_row_end(mm, position, start):
+    # position 이후 첫 '행 끝' 개행 위치 바로 다음을 반환
+    # start부터 개행까지의 따옴표 개수가 홀수면 따옴표 안의 개행이므로 다음 개행을 찾음
+    # ('""'로 이스케이프한 따옴표는 2개씩 세어지므로 짝수/홀수 판단에 영향 없음)
+    size = len(mm)
+    while True:
+        newline = mm.find(b'\n', position)
+        if newline == -1:
+            return size
+        if mm[start:newline].count(b'"') % 2 == 0:
+            return newline + 1
+        position = newline + 1
+
+
+def split_csv_chunks(filename, chunk_size=CHUNK_SIZE):
+    # 헤더를 제외한 본문을 행 경계에 맞춘 (시작, 끝) 바이트 구간 리스트로 나눔
+    with open(filename, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            start = find_row_end(mm, 0, 0)  # 헤더 건너뜀
+            chunks = []
+            while start < size:
+                target = start + chunk_size
+                end = size if target >= size else find_row_end(mm, target - 1, start)
+                chunks.append((start, end))
+                start = end
+    return chunks
+
+
+def parse_csv_chunk(filename, start, end):
+    # 워커 프로세스에서 실행: 바이트 구간 하나를 읽어 InventoryTable 배치로 반환
+    with open(filename, 'rb') as file:
+        file.seek(start)
+        text = file.read(end - start).decode('utf-8')
+    rows = [row for row in csv.reader(io.StringIO(text)) if len(row) == len(COLUMNS)]
+    columns = np.array(rows, dtype=str) if rows else np.empty((0, len(COLUMNS)), dtype=str)
+    return InventoryTable.from_columns(columns)
+
+
+def iter_inventory_batches(filename, workers=None, chunk_size=CHUNK_SIZE):
+    # 조각들을 프로세스 풀에서 동시에 파싱하고, 파일 순서대로 배치를 하나씩 넘겨주는 제너레이터
+    chunks = split_csv_chunks(filename, chunk_size)
+    if not chunks:
+        return
+    starts = [start for start, _ in chunks]
+    ends = [end for _, end in chunks]
+    if len(chunks) == 1 or workers == 1:
+        for start, end in chunks:
+            yield parse_csv_chunk(filename, start, end)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(parse_csv_chunk, repeat(filename), starts, ends)
+
+
+def load_inventory(filename, workers=None, chunk_size=CHUNK_SIZE):
+    # 모든 배치를 이어 붙여 테이블 하나로 반환 (파일이 없으면 None)
+    try:
+        return InventoryTable.concat(iter_inventory_batches(filename, workers, chunk_size))
+    except FileNotFoundError:
+        print('파일을 찾을 수 없습니다:', filename)
+        return None
+    except Exception as e:
+        print('파일 읽기 중 오류 발생:', e)
+        return None
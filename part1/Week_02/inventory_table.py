@@ -0,0 +1,202 @@
+# inventory_table.py
+# 화성 기지 인벤토리 목록을 NumPy 배열(열 단위)로 다루는 모듈
+# 행마다 딕셔너리를 만드는 대신 열마다 배열 하나를 두고, 정렬/필터/저장을 배열 단위로 한 번에 처리함
+# NumPy가 필요합니다: pip install numpy
+
+import os
+
+import numpy as np
+
+COLUMNS = ['Substance', 'Weight', 'Specific Gravity', 'Strength', 'Flammability']
+DANGER_THRESHOLD = 0.7
+
+
+def to_float_column(values):
+    # 문자열 배열을 float 배열과 '숫자인지' 마스크로 변환 ('Various' 같은 값은 NaN, 마스크 False)
+    # 같은 값이 많이 반복되므로 서로 다른 값만 한 번씩 변환한 뒤 배열 인덱싱으로 펼침
+    unique_values, inverse = np.unique(values, return_inverse=True)
+    converted = np.empty(len(unique_values), dtype=np.float64)
+    for i, value in enumerate(unique_values):
+        try:
+            converted[i] = float(value)
+        except ValueError:
+            converted[i] = np.nan
+    floats = converted[inverse.reshape(-1)]
+    return floats, ~np.isnan(floats)
+
+
+def quote_csv_column(values):
+    # 쉼표, 따옴표, 개행이 들어 있는 값만 CSV 규칙대로 따옴표로 감쌈 (나머지는 그대로)
+    needs_quote = ((np.char.find(values, ',') >= 0) | (np.char.find(values, '"') >= 0)
+                   | (np.char.find(values, '\n') >= 0))
+    if not needs_quote.any():
+        return values
+    quoted = np.char.add(np.char.add('"', np.char.replace(values, '"', '""')), '"')
+    return np.where(needs_quote, quoted, values)
+
+
+class InventoryTable:
+    def __init__(self, substance, weight, specific_gravity, strength, flammability):
+        # 원본 문자열 열 (CSV로 다시 저장할 때 그대로 사용)
+        self.substance = np.asarray(substance, dtype=str)
+        self.weight = np.asarray(weight, dtype=str)
+        self.specific_gravity = np.asarray(specific_gravity, dtype=str)
+        self.strength = np.asarray(strength, dtype=str)
+        # 숫자 열: 숫자가 아닌 값은 NaN, *_mask가 False
+        self.flammability = np.asarray(flammability, dtype=np.float64)
+        self.weight_value, self.weight_mask = to_float_column(self.weight)
+        self.specific_gravity_value, self.specific_gravity_mask = to_float_column(self.specific_gravity)
+
+    def __len__(self):
+        return len(self.substance)
+
+    @classmethod
+    def from_columns(cls, columns):
+        # 문자열 2차원 배열(행 x 5열)에서 테이블 생성, 인화성이 숫자가 아닌 행은 제외
+        columns = np.asarray(columns, dtype=str).reshape(-1, len(COLUMNS))
+        flammability, valid = to_float_column(columns[:, 4])
+        columns = columns[valid]
+        return cls(columns[:, 0], columns[:, 1], columns[:, 2], columns[:, 3], flammability[valid])
+
+    @classmethod
+    def from_csv(cls, filename):
+        # CSV 파일 전체를 NumPy의 C 파서로 한 번에 읽어서 테이블 생성
+        try:
+            columns = np.loadtxt(filename, dtype=str, delimiter=',', skiprows=1, ndmin=2,
+                                 encoding='utf-8', comments=None, quotechar='"')
+        except FileNotFoundError:
+            print('파일을 찾을 수 없습니다:', filename)
+            return None
+        except Exception as e:
+            print('파일 읽기 중 오류 발생:', e)
+            return None
+        return cls.from_columns(columns)
+
+    @classmethod
+    def concat(cls, tables):
+        # 여러 테이블(배치)을 순서대로 이어 붙임
+        tables = list(tables)
+        if not tables:
+            return cls.from_columns(np.empty((0, len(COLUMNS)), dtype=str))
+        table = cls.__new__(cls)
+        for name in vars(tables[0]):
+            setattr(table, name, np.concatenate([getattr(part, name) for part in tables]))
+        return table
+
+    def take(self, indices):
+        # 인덱스 배열이나 불리언 마스크로 행을 골라 새 테이블 생성
+        table = InventoryTable.__new__(InventoryTable)
+        for name, value in vars(self).items():
+            setattr(table, name, value[indices])
+        return table
+
+    def sort_by_flammability(self, descending=True):
+        # 인화성 기준 정렬 (같은 값은 원래 순서 유지, 기존 list.sort와 같은 결과)
+        keys = -self.flammability if descending else self.flammability
+        return self.take(np.argsort(keys, kind='stable'))
+
+    def top_k_flammable(self, k):
+        # 인화성이 가장 높은 k개 행의 인덱스 (전체 정렬 없이 np.partition으로 k번째 값만 찾음, 평균 O(n))
+        # k번째 값 이상인 행만 골라 안정 정렬하므로 같은 값은 원래 순서 유지 → sort_by_flammability()의 앞 k개와 같음
+        if k <= 0:
+            return np.empty(0, dtype=np.int64)
+        negated = -self.flammability
+        if k >= len(negated):
+            return np.argsort(negated, kind='stable')
+        kth = np.partition(negated, k - 1)[k - 1]
+        candidates = np.flatnonzero(negated <= kth)
+        return candidates[np.argsort(negated[candidates], kind='stable')[:k]]
+
+    def filter_flammability(self, threshold=DANGER_THRESHOLD):
+        # 인화성이 threshold 이상인 행만 남김
+        return self.take(self.flammability >= threshold)
+
+    def to_records(self):
+        # 행마다 열 이름을 키로 하는 딕셔너리 리스트로 변환 (출력용)
+        return [
+            {
+                'Substance': str(substance),
+                'Weight': str(weight),
+                'Specific Gravity': str(specific_gravity),
+                'Strength': str(strength),
+                'Flammability': float(flammability)
+            }
+            for substance, weight, specific_gravity, strength, flammability in zip(
+                self.substance, self.weight, self.specific_gravity, self.strength, self.flammability)
+        ]
+
+    def to_csv_text(self):
+        # 모든 열을 문자열로 이어 붙여 CSV 본문(헤더 포함)을 한 번에 만듦
+        flammability = self.flammability.astype(str)
+        rows = quote_csv_column(self.substance)
+        for column in (self.weight, self.specific_gravity, self.strength, flammability):
+            rows = np.char.add(np.char.add(rows, ','), quote_csv_column(column))
+        return ','.join(COLUMNS) + '\n' + ''.join(np.char.add(rows, '\n').tolist())
+
+    def save_csv(self, filename):
+        try:
+            with open(filename, 'w', encoding='utf-8') as file:
+                file.write(self.to_csv_text())
+        except Exception as e:
+            print('CSV 저장 중 오류 발생:', e)
+
+
+class FlammabilityIndex:
+    # 인화성 내림차순으로 정렬된 행 번호(order)와 그 값(-인화성, 오름차순)을 들고 있는 색인
+    # 한 번 만들어두면 임계값/범위 질의는 이진 탐색 O(log n) + 결과 k개 O(k)
+    def __init__(self, order, negated_values):
+        self.order = order
+        self.negated_values = negated_values
+
+    @classmethod
+    def build(cls, table):
+        order = np.argsort(-table.flammability, kind='stable')
+        return cls(order, -table.flammability[order])
+
+    @classmethod
+    def load_or_build(cls, table, source_path):
+        # 원본 CSV의 크기/수정 시각이 같으면 디스크에 저장된 색인을 쓰고, 다르면 새로 만들어 저장
+        cache_path = get_index_cache_path(source_path)
+        stat = os.stat(source_path)
+        try:
+            with np.load(cache_path) as cached:
+                if (int(cached['source_size']) == stat.st_size
+                        and int(cached['source_mtime_ns']) == stat.st_mtime_ns
+                        and len(cached['order']) == len(table)):
+                    return cls(cached['order'], cached['negated_values'])
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print('색인 캐시 읽기 중 오류 발생, 새로 만듭니다:', e)
+
+        index = cls.build(table)
+        try:
+            # 임시 파일에 다 쓴 뒤 교체해서, 중간에 실패하거나 다른 실행이 읽는 중이어도 깨진 캐시가 보이지 않게 함
+            temp_path = cache_path + '.tmp'
+            with open(temp_path, 'wb') as file:
+                np.savez(file, order=index.order, negated_values=index.negated_values,
+                         source_size=stat.st_size, source_mtime_ns=stat.st_mtime_ns)
+            os.replace(temp_path, cache_path)
+        except Exception as e:
+            print('색인 캐시 저장 중 오류 발생:', e)
+        return index
+
+    def top_k(self, k):
+        # 인화성 상위 k개 행 번호 (이미 정렬되어 있으므로 O(k))
+        return self.order[:k]
+
+    def at_least(self, threshold):
+        # 인화성 >= threshold 인 행 번호 (인화성 내림차순)
+        end = np.searchsorted(self.negated_values, -threshold, side='right')
+        return self.order[:end]
+
+    def between(self, low, high):
+        # low <= 인화성 <= high 인 행 번호 (인화성 내림차순)
+        start = np.searchsorted(self.negated_values, -high, side='left')
+        end = np.searchsorted(self.negated_values, -low, side='right')
+        return self.order[start:end]
+
+
+def get_index_cache_path(source_path):
+    # 색인 캐시는 원본 CSV 옆에 저장
+    return source_path + '.flammability_index.npz'
@@ -0,0 +1,63 @@
+# verify_binary.py
+# CSV → 이진 파일 → 다시 읽기 왕복 결과가 원본 CSV와 같은지 확인하는 스크립트
+# 사용 예: python verify_binary.py [CSV 파일 경로]
+
+import math
+import os
+import random
+import sys
+import tempfile
+
+from inventory_binary import InventoryBinaryReader, to_float, write_inventory_binary
+from inventory_table import InventoryTable
+
+DEFAULT_CSV_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Mars_Base_Inventory_List.csv')
+
+
+def same_row(expected, actual):
+    for key, value in expected.items():
+        if actual[key] != value:
+            return False
+    # 함께 저장한 숫자 값도 원본 문자열을 변환한 값과 같은지 확인 (둘 다 NaN이면 같음)
+    for text_key, value_key in (('Weight', 'Weight Value'), ('Specific Gravity', 'Specific Gravity Value')):
+        expected_value = to_float(expected[text_key])
+        if not (actual[value_key] == expected_value
+                or (math.isnan(actual[value_key]) and math.isnan(expected_value))):
+            return False
+    return True
+
+
+def verify(csv_path):
+    table = InventoryTable.from_csv(csv_path)
+    if table is None:
+        return False
+    records = table.to_records()
+
+    fd, bin_path = tempfile.mkstemp(suffix='.bin')
+    os.close(fd)
+    try:
+        write_inventory_binary(bin_path, records)
+        with InventoryBinaryReader(bin_path) as reader:
+            if len(reader) != len(records):
+                print(f'행 수 불일치: CSV {len(records)} / 이진 파일 {len(reader)}')
+                return False
+            # 전체 순서대로 비교
+            for index, (expected, actual) in enumerate(zip(records, reader)):
+                if not same_row(expected, actual):
+                    print(f'{index}번째 행 불일치: {expected} / {actual}')
+                    return False
+            # 임의의 위치를 바로 읽어도 같은지 비교 (mmap 임의 접근)
+            for index in random.sample(range(len(records)), min(len(records), 20)):
+                if not same_row(records[index], reader.get_row(index)):
+                    print(f'{index}번째 행 임의 접근 결과 불일치')
+                    return False
+    finally:
+        os.remove(bin_path)
+
+    print(f'왕복 확인 완료: {len(records)}행 모두 일치')
+    return True
+
+
+if __name__ == '__main__':
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_CSV_PATH
+    sys.exit(0 if verify(path) else 1)
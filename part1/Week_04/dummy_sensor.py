@@ -1,13 +1,53 @@
 # dummy_sensor.py
 
+import atexit
 import random
+import time
 from datetime import datetime
 
 CSV_OUTPUT_PATH = 'sensor_log.txt'
+LOG_BATCH_SIZE = 100  # 이만큼 쌓이면 파일에 씀
+LOG_FLUSH_INTERVAL = 1.0  # 마지막으로 쓴 뒤 이 시간(초)이 지나면 쌓인 만큼 파일에 씀
+
+
+class BufferedLogWriter:
+    # 측정값마다 파일을 열고 닫지 않고, 메모리에 모아두었다가 한 번에 쓰는 로그 작성기
+    # 프로그램이 종료될 때(atexit) 남은 로그를 자동으로 기록함
+    def __init__(self, path, batch_size=LOG_BATCH_SIZE, flush_interval=LOG_FLUSH_INTERVAL):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.buffer = []
+        self.file = None
+        self.last_flush = time.monotonic()
+        atexit.register(self.close)
+
+    def write(self, line):
+        self.buffer.append(line)
+        if (len(self.buffer) >= self.batch_size
+                or time.monotonic() - self.last_flush >= self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        if self.buffer:
+            if self.file is None:
+                self.file = open(self.path, 'a', encoding='utf-8')
+            self.file.write(''.join(self.buffer))
+            self.file.flush()
+            self.buffer.clear()
+        self.last_flush = time.monotonic()
+
+    def close(self):
+        self.flush()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
 
 
 class DummySensor:
-    def __init__(self):
+    def __init__(self, log_path=CSV_OUTPUT_PATH, batch_size=LOG_BATCH_SIZE,
+                 flush_interval=LOG_FLUSH_INTERVAL):
+        self.log_writer = BufferedLogWriter(log_path, batch_size, flush_interval)
         self.env_values = {
             'mars_base_internal_temperature': 0,
             'mars_base_external_temperature': 0,
@@ -36,7 +76,13 @@ class DummySensor:
             f"{self.env_values['mars_base_internal_oxygen']}%\n"
         )
 
-        with open(CSV_OUTPUT_PATH, 'a', encoding='utf-8') as log_file:
-            log_file.write(log_line)
+        self.log_writer.write(log_line)
 
         return self.env_values
+
+    def flush(self):
+        # 버퍼에 쌓인 로그를 지금 바로 파일에 씀
+        self.log_writer.flush()
+
+    def close(self):
+        self.log_writer.close()
@@ -36,6 +36,7 @@ class MissionComputer:
             for _ in range(50):
                 if is_q_pressed():
                     print("\nSystem stopped…")
+                    self.sensor.flush()  # 버퍼에 남은 센서 로그 기록
                     return
                 time.sleep(0.1)
 
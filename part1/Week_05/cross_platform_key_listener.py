@@ -1,7 +1,13 @@
+import asyncio
+import os
+import queue
 import sys
 import platform
+import threading
 import time
 
+KEY_POLL_INTERVAL = 0.02  # Windows에서 키 입력을 확인하는 간격 (초)
+
 def is_q_pressed():
     current_os = platform.system()
 
@@ -33,3 +39,152 @@ def is_q_pressed():
 
     else:
         raise OSError("Unsupported OS: " + current_os)
+
+
+class KeyListener:
+    # 터미널을 cbreak 모드로 한 번만 바꾸고, 백그라운드 스레드가 키 입력을 큐에 모아두는 키 리스너
+    # poll()은 시스템 호출 없이 큐만 확인하므로 아무리 자주 불러도 부담이 없음
+    # 리눅스/맥에서는 키가 들어올 때마다 읽기 가능해지는 fd(fileno())를 제공해서 select/asyncio로 기다릴 수 있음
+    #
+    # 사용 예:
+    #   with KeyListener() as keys:
+    #       while not keys.pressed('q'):
+    #           ...
+    def __init__(self):
+        self.os_name = platform.system()
+        if self.os_name not in ('Windows', 'Linux', 'Darwin'):
+            raise OSError("Unsupported OS: " + self.os_name)
+        self.keys = queue.SimpleQueue()
+        self.thread = None
+        self.stopped = threading.Event()
+        self.fd = None
+        self.old_settings = None
+        self.notify_read = None  # 키가 들어오면 1바이트씩 쓰이는 파이프 (fileno()로 제공)
+        self.notify_write = None
+        self.stop_read = None  # 리더 스레드를 깨워서 종료시키는 파이프
+        self.stop_write = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        if self.os_name == 'Windows':
+            self.thread = threading.Thread(target=self.read_windows, daemon=True)
+        else:
+            import termios
+            import tty
+
+            self.fd = sys.stdin.fileno()
+            if os.isatty(self.fd):
+                self.old_settings = termios.tcgetattr(self.fd)
+                tty.setcbreak(self.fd)
+            self.notify_read, self.notify_write = os.pipe()
+            os.set_blocking(self.notify_read, False)
+            os.set_blocking(self.notify_write, False)
+            self.stop_read, self.stop_write = os.pipe()
+            self.thread = threading.Thread(target=self.read_posix, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        if self.stop_write is not None:
+            os.write(self.stop_write, b'x')
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        if self.old_settings is not None:
+            import termios
+            termios.tcsetattr(self.fd, termios.TCSADRAIN, self.old_settings)
+            self.old_settings = None
+        for name in ('notify_read', 'notify_write', 'stop_read', 'stop_write'):
+            fd = getattr(self, name)
+            if fd is not None:
+                os.close(fd)
+                setattr(self, name, None)
+
+    def read_posix(self):
+        import select
+
+        while not self.stopped.is_set():
+            readable, _, _ = select.select([self.fd, self.stop_read], [], [])
+            if self.stop_read in readable:
+                return
+            data = os.read(self.fd, 1024)
+            if not data:
+                return  # 입력이 끝남(EOF)
+            for key in data.decode('utf-8', errors='ignore'):
+                self.keys.put(key)
+                try:
+                    os.write(self.notify_write, b'k')
+                except BlockingIOError:
+                    pass  # 알림 파이프가 가득 차도 키는 큐에 남아 있음
+
+    def read_windows(self):
+        import msvcrt
+
+        while not self.stopped.is_set():
+            while msvcrt.kbhit():
+                self.keys.put(msvcrt.getwch())
+            time.sleep(KEY_POLL_INTERVAL)
+
+    def fileno(self):
+        # 키 입력이 쌓이면 읽기 가능해지는 fd (윈도우는 지원하지 않음)
+        if self.notify_read is None:
+            raise OSError('이 운영체제에서는 pollable fd를 지원하지 않습니다.')
+        return self.notify_read
+
+    def poll(self):
+        # 쌓인 키 하나를 꺼내서 반환, 없으면 None (기다리지 않음)
+        try:
+            key = self.keys.get_nowait()
+        except queue.Empty:
+            return None
+        if self.notify_read is not None:
+            try:
+                os.read(self.notify_read, 1)
+            except BlockingIOError:
+                pass
+        return key
+
+    def pressed(self, key):
+        # 지금까지 쌓인 키를 모두 꺼내서 그중에 key가 있었는지 반환 (대소문자 무시)
+        key = key.lower()
+        found = False
+        while True:
+            pressed_key = self.poll()
+            if pressed_key is None:
+                return found
+            if pressed_key.lower() == key:
+                found = True
+
+
+async def watch_key(stop_event, key='q'):
+    # KeyListener를 이벤트 루프에 한 번만 등록해두고, key가 눌리면 stop_event를 설정하는 코루틴
+    # 리눅스/맥: 리스너의 fd를 loop.add_reader로 감시 (폴링 없음)
+    # 윈도우: 이벤트 루프에 등록할 fd가 없으므로 짧은 간격으로 큐만 확인
+    loop = asyncio.get_running_loop()
+    with KeyListener() as listener:
+        if listener.os_name == 'Windows':
+            while not stop_event.is_set():
+                if listener.pressed(key):
+                    stop_event.set()
+                    break
+                try:
+                    await asyncio.wait_for(stop_event.wait(), timeout=KEY_POLL_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
+            return
+
+        def on_key():
+            if listener.pressed(key):
+                stop_event.set()
+
+        loop.add_reader(listener.fileno(), on_key)
+        try:
+            await stop_event.wait()
+        finally:
+            loop.remove_reader(listener.fileno())
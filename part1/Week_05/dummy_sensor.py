@@ -1,13 +1,68 @@
 # dummy_sensor.py
 
+import atexit
 import random
+import time
 from datetime import datetime
 
+from sensor_log_binary import pack_reading, write_header_if_needed
+
+try:
+    import numpy as np  # generate_batch()에만 필요: pip install numpy
+except ImportError:
+    np = None
+
 CSV_OUTPUT_PATH = 'sensor_log.txt'
+LOG_BATCH_SIZE = 100  # 이만큼 쌓이면 파일에 씀
+LOG_FLUSH_INTERVAL = 1.0  # 마지막으로 쓴 뒤 이 시간(초)이 지나면 쌓인 만큼 파일에 씀
+
+
+class BufferedLogWriter:
+    # 측정값마다 파일을 열고 닫지 않고, 메모리에 모아두었다가 한 번에 쓰는 로그 작성기
+    # 프로그램이 종료될 때(atexit) 남은 로그를 자동으로 기록함
+    def __init__(self, path, batch_size=LOG_BATCH_SIZE, flush_interval=LOG_FLUSH_INTERVAL, binary=False):
+        # binary=True이면 bytes 레코드를 그대로 이어서 씀 (이진 센서 로그용)
+        self.path = path
+        self.binary = binary
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.buffer = []
+        self.file = None
+        self.last_flush = time.monotonic()
+        atexit.register(self.close)
+
+    def write(self, line):
+        self.buffer.append(line)
+        if (len(self.buffer) >= self.batch_size
+                or time.monotonic() - self.last_flush >= self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        if self.buffer:
+            if self.file is None:
+                self.file = open(self.path, 'ab') if self.binary else open(self.path, 'a', encoding='utf-8')
+            self.file.write((b'' if self.binary else '').join(self.buffer))
+            self.file.flush()
+            self.buffer.clear()
+        self.last_flush = time.monotonic()
+
+    def close(self):
+        self.flush()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
 
 
 class DummySensor:
-    def __init__(self):
+    def __init__(self, log_path=CSV_OUTPUT_PATH, batch_size=LOG_BATCH_SIZE,
+                 flush_interval=LOG_FLUSH_INTERVAL, binary_log_path=None):
+        self.log_writer = BufferedLogWriter(log_path, batch_size, flush_interval)
+        # binary_log_path를 주면 같은 측정값을 고정 크기 이진 레코드로도 기록 (sensor_log_binary.py 참고)
+        self.binary_log_writer = None
+        if binary_log_path is not None:
+            write_header_if_needed(binary_log_path)
+            self.binary_log_writer = BufferedLogWriter(binary_log_path, batch_size, flush_interval, binary=True)
+        self.batch_rng = None  # generate_batch()용 NumPy 난수 생성기 (처음 사용할 때 만듦)
         self.env_values = {
             'mars_base_internal_temperature': 0,
             'mars_base_external_temperature': 0,
@@ -25,6 +80,24 @@ class DummySensor:
         self.env_values['mars_base_internal_co2'] = round(random.uniform(0.02, 0.1), 4)
         self.env_values['mars_base_internal_oxygen'] = round(random.uniform(4.0, 7.0), 2)
 
+    def generate_batch(self, n, seed=None):
+        # set_env()와 같은 범위/반올림으로 측정값 n개를 NumPy 배열로 한 번에 생성
+        # 반환값: env_values와 같은 키를 가진 딕셔너리, 값은 길이 n의 배열
+        # seed를 주면 생성기를 다시 만들어서 같은 seed로 항상 같은 값이 나옴
+        if np is None:
+            raise ImportError('generate_batch()를 사용하려면 numpy가 필요합니다: pip install numpy')
+        if seed is not None or self.batch_rng is None:
+            self.batch_rng = np.random.default_rng(seed)
+        rng = self.batch_rng
+        return {
+            'mars_base_internal_temperature': rng.integers(18, 30, size=n, endpoint=True),
+            'mars_base_external_temperature': rng.integers(0, 21, size=n, endpoint=True),
+            'mars_base_internal_humidity': rng.integers(50, 60, size=n, endpoint=True),
+            'mars_base_external_illuminance': rng.integers(500, 715, size=n, endpoint=True),
+            'mars_base_internal_co2': np.round(rng.uniform(0.02, 0.1, size=n), 4),
+            'mars_base_internal_oxygen': np.round(rng.uniform(4.0, 7.0, size=n), 2)
+        }
+
     def get_env(self):
         log_line = (
             f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}, "
@@ -36,7 +109,19 @@ class DummySensor:
             f"{self.env_values['mars_base_internal_oxygen']}%\n"
         )
 
-        with open(CSV_OUTPUT_PATH, 'a', encoding='utf-8') as log_file:
-            log_file.write(log_line)
+        self.log_writer.write(log_line)
+        if self.binary_log_writer is not None:
+            self.binary_log_writer.write(pack_reading(time.time_ns(), self.env_values))
 
         return self.env_values
+
+    def flush(self):
+        # 버퍼에 쌓인 로그를 지금 바로 파일에 씀
+        self.log_writer.flush()
+        if self.binary_log_writer is not None:
+            self.binary_log_writer.flush()
+
+    def close(self):
+        self.log_writer.close()
+        if self.binary_log_writer is not None:
+            self.binary_log_writer.close()
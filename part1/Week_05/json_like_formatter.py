@@ -0,0 +1,48 @@
+# json_like_formatter.py
+# MissionComputer.format_json_like()와 같은 모양의 출력을 빠르게 만드는 포매터
+#
+# 키 목록이 같으면 출력 틀(template)은 매번 같으므로, 키 조합마다 한 번만 만들어 두고
+# 측정값마다 값만 채워서 문자열 하나로 만든 뒤 write() 한 번으로 출력함 (키마다 print() 하지 않음)
+# min_interval을 주면 측정 주기와 상관없이 화면 갱신을 그 간격(초)으로 제한함
+
+import sys
+import time
+
+
+def build_template(keys):
+    # ('a', 'b') → "{{\n  'a': {},\n  'b': {}\n}}\n" (마지막 항목은 쉼표 없음)
+    # 바깥 중괄호와 키에 들어 있는 중괄호는 str.format()이 자리표시자로 읽지 않도록 두 번 씀
+    lines = [f"  '{key}'".replace('{', '{{').replace('}', '}}') + ': {}' for key in keys]
+    return '{{\n' + ',\n'.join(lines) + ('\n' if lines else '') + '}}\n'
+
+
+def format_value(value):
+    return f"'{value}'" if isinstance(value, str) else value
+
+
+class JsonLikeFormatter:
+    def __init__(self, stream=None, min_interval=0.0):
+        self.stream = stream  # None이면 출력할 때의 sys.stdout 사용
+        self.min_interval = min_interval
+        self.templates = {}  # 키 튜플 → 출력 틀
+        self.last_write = None
+
+    def render(self, data):
+        keys = tuple(data)
+        template = self.templates.get(keys)
+        if template is None:
+            template = self.templates[keys] = build_template(keys)
+        return template.format(*map(format_value, data.values()))
+
+    def write(self, data, prefix='', suffix='', force=False):
+        # data를 렌더링해서 앞뒤 문자열과 함께 한 번에 출력
+        # 마지막 출력 후 min_interval초가 지나지 않았으면 건너뛰고 False 반환 (force=True면 항상 출력)
+        now = time.monotonic()
+        if (not force and self.last_write is not None
+                and now - self.last_write < self.min_interval):
+            return False
+        self.last_write = now
+        stream = self.stream or sys.stdout
+        stream.write(prefix + self.render(data) + suffix)
+        stream.flush()
+        return True
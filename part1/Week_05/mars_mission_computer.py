@@ -1,20 +1,62 @@
+import asyncio
+import math
 import time
-import platform
-import os
-import psutil
+from concurrent.futures import ThreadPoolExecutor
 from dummy_sensor import DummySensor
-from cross_platform_key_listener import is_q_pressed
+from cross_platform_key_listener import KeyListener, watch_key
+from json_like_formatter import JsonLikeFormatter
+from rolling_stats import RollingAggregator
+from system_metrics import MetricsCollector, get_static_info
+
+SAMPLE_INTERVAL = 5.0  # 센서 측정 간격 (초)
+AVERAGE_INTERVAL = 30.0  # 평균 출력 간격 (테스트용: 30초, 원래는 5분)
+DISPLAY_INTERVAL = 0.0  # 센서 값 화면 갱신 최소 간격 (초, 0이면 측정할 때마다 출력)
+QUIT_HINT = "키보드의 'q' 키를 누르면 종료됩니다.\n"
 
 ds = DummySensor()
 
 
+async def wait_next_tick(loop, next_time, interval, stop_event):
+    # 다음 측정 시각을 '시작 시각 + n * interval'로 잡아서 처리 시간만큼 밀리지 않도록 보정
+    # 너무 늦어서 측정 시각을 놓치면 밀린 만큼 건너뛰고 다음 시각에 맞춤
+    # 반환값: (다음 측정 시각, 건너뛴 횟수)
+    next_time += interval
+    missed = 0
+    behind = loop.time() - next_time
+    if behind > 0:
+        missed = math.ceil(behind / interval)
+        next_time += missed * interval
+    try:
+        # 종료 신호(stop_event)가 오면 대기 중에도 바로 깨어남
+        await asyncio.wait_for(stop_event.wait(), timeout=max(0.0, next_time - loop.time()))
+    except asyncio.TimeoutError:
+        pass
+    return next_time, missed
+
+
+def make_dummy_reader(sensor):
+    # DummySensor를 register_sensor()에 넘길 수 있는 '측정값 딕셔너리를 반환하는 함수'로 감쌈
+    def read():
+        sensor.set_env()
+        return dict(sensor.get_env())
+    return read
+
+
 class MissionComputer:
-    def __init__(self):
+    def __init__(self, display_interval=DISPLAY_INTERVAL):
         self.env_values = {}
+        # 키 조합마다 출력 틀을 한 번만 만들고, 센서 값 출력은 display_interval초 간격으로 제한
+        self.formatter = JsonLikeFormatter(min_interval=display_interval)
         self.sensor = ds
-        # 처음에 센서 데이터 키를 기준으로 빈 리스트를 가진 딕셔너리 생성
-        self.history = {key: [] for key in self.sensor.get_env()}
+        # 센서 키마다 1분/5분/1시간 이동 구간 통계를 고정 메모리로 유지
+        self.aggregator = RollingAggregator(self.sensor.env_values.keys())
         self.settings = self.load_settings()
+        # 여러 센서 동시 수집용: 이름 → (측정 함수, 측정 간격), 이름 → RollingAggregator
+        self.sources = {}
+        self.source_aggregators = {}
+        # 시스템 부하는 백그라운드 스레드가 미리 측정해 두고, 부하 정보 출력 시에는 바로 꺼내 씀
+        # 수집 스레드는 부하 정보를 처음 요청할 때 시작하고, 센서 수집이 끝나면 stop_metrics()로 멈춤
+        self.metrics = MetricsCollector()
 
     def load_settings(self):
         settings = []
@@ -29,25 +71,16 @@ class MissionComputer:
         return settings
 
     def format_json_like(self, data):
-        print('{')
-        keys = list(data.keys())
-        for i, key in enumerate(keys):
-            value = data[key]
-            if isinstance(value, str):
-                value = f"'{value}'"
-            comma = ',' if i < len(keys) - 1 else ''
-            print(f"  '{key}': {value}{comma}")
-        print('}')
+        # 출력 모양은 그대로 두고, 미리 만든 틀에 값만 채워서 한 번에 출력
+        self.formatter.write(data, force=True)
+
+    def display_sensor_values(self, values, prefix=''):
+        # 측정값 출력: 화면 갱신 간격(display_interval)보다 자주 들어오면 출력만 건너뜀 (측정/통계는 계속)
+        self.formatter.write(values, prefix=prefix, suffix=QUIT_HINT)
 
     def get_mission_computer_info(self):
         try:
-            info = {
-                'os_name': platform.system(),
-                'os_version': platform.version(),
-                'cpu_type': platform.processor(),
-                'cpu_core_count': os.cpu_count(),
-                'memory_total': round(psutil.virtual_memory().total / (1024 ** 3), 2)  # GB
-            }
+            info = get_static_info()  # 처음 한 번만 조회하고 이후에는 캐시 사용
 
             filtered_info = {
                 key: info[key] for key in self.settings if key in info
@@ -59,12 +92,20 @@ class MissionComputer:
         except Exception as e:
             print(f'시스템 정보 수집 중 오류 발생: {e}')
 
-    def get_mission_computer_load(self):
+    def get_mission_computer_load(self, window_seconds=None):
+        # window_seconds를 주면 최근 그 시간 동안의 평균, 없으면 가장 최근 측정값을 출력
+        # 수집 스레드가 미리 측정해 두므로 기다리지 않음 (시작 직후 첫 측정 전이면 한 번만 잠깐 기다림)
         try:
-            load = {
-                'cpu_usage_percent': psutil.cpu_percent(interval=1),
-                'memory_usage_percent': psutil.virtual_memory().percent
-            }
+            self.metrics.start()  # 이미 실행 중이면 아무것도 하지 않음
+            if window_seconds is None:
+                load = self.metrics.latest(timeout=self.metrics.interval * 2)
+            else:
+                self.metrics.latest(timeout=self.metrics.interval * 2)
+                load = self.metrics.average(window_seconds)
+            if load is None:
+                print('시스템 부하 측정값이 아직 없습니다.')
+                return
+            load.pop('timestamp')
 
             filtered_load = {
                 key: load[key] for key in self.settings if key in load
@@ -76,41 +117,165 @@ class MissionComputer:
         except Exception as e:
             print(f'시스템 부하 수집 중 오류 발생: {e}')
 
+    def stop_metrics(self):
+        # 시스템 부하 수집 스레드를 멈춤 (다시 get_mission_computer_load()를 부르면 새로 시작됨)
+        self.metrics.stop()
+
     def get_sensor_data(self):
         start_time = time.time()
         print("센서 데이터 수집 시작 (q 키를 누르면 종료)\n")
 
-        while True:
+        # 터미널 설정은 시작할 때 한 번만 바꾸고, 키 확인은 큐만 보는 pressed()로 처리
+        with KeyListener() as keys:
+            while True:
+                self.sensor.set_env()
+                self.env_values = self.sensor.get_env()
+
+                # 이동 구간 통계에 반영 (값을 쌓아두지 않고 버킷 합계만 갱신)
+                self.aggregator.update(self.env_values)
+
+                self.display_sensor_values(self.env_values)
+
+                if time.time() - start_time >= 30:  # 테스트용: 30초
+                    self.print_5min_average()
+                    start_time = time.time()
+
+                for _ in range(50):  # 5초 동안 0.1초 간격
+                    if keys.pressed('q'):
+                        print("\nSystem stopped…")
+                        self.sensor.flush()  # 버퍼에 남은 센서 로그 기록
+                        self.stop_metrics()
+                        return
+                    time.sleep(0.1)
+
+    def get_sensor_data_async(self, interval=SAMPLE_INTERVAL):
+        # asyncio 이벤트 루프로 센서를 고정 주기로 측정하고, q 키는 입력이 들어올 때만 처리
+        # 종료 시 측정 시점의 지터(예정 시각과 실제 시각의 차이) 통계를 출력
+        print("센서 데이터 수집 시작 (q 키를 누르면 종료)\n")
+        jitter = asyncio.run(self.run_sampling(interval))
+        print("\nSystem stopped…")
+        self.sensor.flush()  # 버퍼에 남은 센서 로그 기록
+        self.stop_metrics()
+        self.print_jitter_report(jitter)
+
+    async def run_sampling(self, interval):
+        stop_event = asyncio.Event()
+        key_task = asyncio.create_task(watch_key(stop_event, 'q'))
+        try:
+            return await self.sample_periodically(interval, stop_event)
+        finally:
+            stop_event.set()
+            await key_task
+
+    async def sample_periodically(self, interval, stop_event):
+        # wait_next_tick()으로 고정 주기를 유지하면서 측정
+        loop = asyncio.get_running_loop()
+        next_time = loop.time()
+        last_average_time = next_time
+        jitter = {'count': 0, 'sum': 0.0, 'square_sum': 0.0, 'max': 0.0, 'skipped': 0}
+
+        while not stop_event.is_set():
+            delay = abs(loop.time() - next_time)
+            jitter['count'] += 1
+            jitter['sum'] += delay
+            jitter['square_sum'] += delay * delay
+            jitter['max'] = max(jitter['max'], delay)
+
             self.sensor.set_env()
             self.env_values = self.sensor.get_env()
+            self.aggregator.update(self.env_values)
+            self.display_sensor_values(self.env_values)
 
-            # 각 키에 대해 값을 나눠서 저장함 (평균 계산 쉽게 하려고 이렇게 함)
-            for key in self.env_values:
-                self.history[key].append(self.env_values[key])
+            if loop.time() - last_average_time >= AVERAGE_INTERVAL:
+                self.print_5min_average()
+                last_average_time = loop.time()
 
-            self.format_json_like(self.env_values)
+            # q 키가 눌리면 stop_event가 설정되어 대기 중에도 바로 종료됨
+            next_time, missed = await wait_next_tick(loop, next_time, interval, stop_event)
+            jitter['skipped'] += missed
+        return jitter
 
-            if time.time() - start_time >= 30:  # 테스트용: 30초
-                self.print_5min_average()
-                # 평균 출력 후 기록 초기화
-                self.history = {key: [] for key in self.env_values}
-                start_time = time.time()
+    def register_sensor(self, name, read, interval=SAMPLE_INTERVAL):
+        # 센서를 등록: read는 호출하면 측정값 딕셔너리를 반환하는 함수, interval은 그 센서만의 측정 간격(초)
+        # DummySensor는 make_dummy_reader(sensor)로 감싸서 등록
+        self.sources[name] = (read, interval)
+
+    def get_multi_sensor_data(self, max_workers=None):
+        # 등록한 모든 센서를 각자의 주기로 동시에 측정하고, 측정값을 시간순 스트림 하나로 합쳐서 출력
+        # 센서 읽기는 스레드 풀에서 실행하므로 느린 센서가 있어도 다른 센서는 제 주기대로 측정됨
+        if not self.sources:
+            self.register_sensor('main', make_dummy_reader(self.sensor))
+        print(f"센서 {len(self.sources)}개 데이터 수집 시작 (q 키를 누르면 종료)\n")
+        asyncio.run(self.run_sensors(max_workers))
+        print("\nSystem stopped…")
+        self.sensor.flush()  # 버퍼에 남은 센서 로그 기록
+        self.stop_metrics()
+
+    async def run_sensors(self, max_workers=None):
+        stop_event = asyncio.Event()
+        readings = asyncio.Queue()
+        # 기본은 센서마다 스레드 하나: 느린 센서가 여러 개 있어도 나머지 센서가 빈 스레드를 기다리지 않음
+        executor = ThreadPoolExecutor(max_workers=max_workers or len(self.sources))
+        tasks = [
+            asyncio.create_task(self.poll_sensor(name, read, interval, executor, readings, stop_event))
+            for name, (read, interval) in self.sources.items()
+        ]
+        consumer = asyncio.create_task(self.consume_readings(readings))
+        try:
+            await watch_key(stop_event, 'q')
+        finally:
+            stop_event.set()
+            # 읽는 중인 센서를 기다리지 않고 바로 종료 (멈춘 센서가 있어도 q 키에 바로 반응)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await readings.join()  # 이미 들어온 측정값은 모두 처리
+            consumer.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def poll_sensor(self, name, read, interval, executor, readings, stop_event):
+        # 센서 하나를 자기 주기대로 측정해서 공용 큐(readings)에 넣는 작업
+        loop = asyncio.get_running_loop()
+        next_time = loop.time()
+        while not stop_event.is_set():
+            try:
+                values = await loop.run_in_executor(executor, read)
+            except Exception as e:
+                print(f'[{name}] 센서 읽기 중 오류 발생: {e}')
+            else:
+                await readings.put((time.time(), name, values))
+            next_time, _ = await wait_next_tick(loop, next_time, interval, stop_event)
 
-            print("키보드의 'q' 키를 누르면 종료됩니다.")
+    async def consume_readings(self, readings):
+        # 모든 센서의 측정값을 들어온 순서(시간순)대로 하나씩 처리
+        while True:
+            timestamp, name, values = await readings.get()
+            try:
+                aggregator = self.source_aggregators.get(name)
+                if aggregator is None:
+                    aggregator = self.source_aggregators[name] = RollingAggregator(values.keys())
+                aggregator.update(values, timestamp)
+                self.display_sensor_values(values, prefix=f"[{time.strftime('%H:%M:%S', time.localtime(timestamp))}] {name}\n")
+            finally:
+                readings.task_done()
 
-            for _ in range(50):  # 5초 동안 0.1초 간격
-                if is_q_pressed():
-                    print("\nSystem stopped…")
-                    return
-                time.sleep(0.1)
+    def print_jitter_report(self, jitter):
+        count = jitter['count']
+        if count == 0:
+            return
+        mean = jitter['sum'] / count
+        stddev = math.sqrt(max(jitter['square_sum'] / count - mean * mean, 0.0))
+        print('\n=== 샘플링 지터 ===')
+        print(f'측정 횟수: {count}')
+        print(f'평균: {mean * 1000:.3f}ms, 최대: {jitter["max"] * 1000:.3f}ms, 표준편차: {stddev * 1000:.3f}ms')
+        print(f'놓친 측정 시각: {jitter["skipped"]}')
+        print('==================\n')
 
     def print_5min_average(self):
         print('\n=== 5분 평균 환경 정보 ===')
-        for key, values in self.history.items():
-            if values:
-                avg = round(sum(values) / len(values), 2)
-                # 평균은 소수점 둘째 자리까지 반올림
-                print(f'{key}: {avg}')
+        for key, stats in self.aggregator.get_stats('5min').items():
+            # 평균은 소수점 둘째 자리까지 반올림
+            print(f"{key}: {round(stats['mean'], 2)}")
         print('==========================\n')
 
 
@@ -118,4 +283,4 @@ if __name__ == '__main__':
     RunComputer = MissionComputer()
     RunComputer.get_mission_computer_info()
     RunComputer.get_mission_computer_load()
-    RunComputer.get_sensor_data()
+    RunComputer.get_sensor_data_async()
@@ -0,0 +1,109 @@
+# rolling_stats.py
+# 센서 값의 이동 구간(1분, 5분, 1시간 등) 평균/최소/최대/표준편차를 실시간으로 계산하는 모듈
+#
+# 구간마다 고정 개수의 버킷(ring buffer)에 합계/제곱합/최소/최대/개수만 저장하므로
+# 측정 속도와 상관없이 메모리는 일정하고, 값 하나 추가는 O(1)
+# 오래된 값은 버킷 단위(구간 / 버킷 수)로 시간이 지나면 자동으로 빠짐
+
+import math
+import time
+
+DEFAULT_WINDOWS = {
+    '1min': 60,
+    '5min': 300,
+    '1h': 3600
+}
+DEFAULT_BUCKETS = 60
+
+
+class RollingWindow:
+    def __init__(self, seconds, buckets=DEFAULT_BUCKETS):
+        self.seconds = seconds
+        self.buckets = buckets
+        self.bucket_width = seconds / buckets
+        self.bucket_ids = [None] * buckets
+        self.counts = [0] * buckets
+        self.sums = [0.0] * buckets
+        self.square_sums = [0.0] * buckets
+        self.mins = [0.0] * buckets
+        self.maxs = [0.0] * buckets
+
+    def add(self, value, timestamp):
+        bucket_id = int(timestamp // self.bucket_width)
+        slot = bucket_id % self.buckets
+        if self.bucket_ids[slot] != bucket_id:
+            # 한 바퀴 전(구간 밖)의 버킷이면 비우고 새로 시작
+            self.bucket_ids[slot] = bucket_id
+            self.counts[slot] = 1
+            self.sums[slot] = value
+            self.square_sums[slot] = value * value
+            self.mins[slot] = value
+            self.maxs[slot] = value
+            return
+        self.counts[slot] += 1
+        self.sums[slot] += value
+        self.square_sums[slot] += value * value
+        if value < self.mins[slot]:
+            self.mins[slot] = value
+        if value > self.maxs[slot]:
+            self.maxs[slot] = value
+
+    def get_stats(self, now):
+        # 현재 구간 안에 있는 버킷만 모아서 통계를 계산, 값이 없으면 None
+        current_id = int(now // self.bucket_width)
+        count = 0
+        total = 0.0
+        square_total = 0.0
+        minimum = math.inf
+        maximum = -math.inf
+        for slot, bucket_id in enumerate(self.bucket_ids):
+            if bucket_id is None or not current_id - self.buckets < bucket_id <= current_id:
+                continue
+            count += self.counts[slot]
+            total += self.sums[slot]
+            square_total += self.square_sums[slot]
+            minimum = min(minimum, self.mins[slot])
+            maximum = max(maximum, self.maxs[slot])
+        if count == 0:
+            return None
+        mean = total / count
+        variance = max(square_total / count - mean * mean, 0.0)
+        return {
+            'count': count,
+            'mean': mean,
+            'min': minimum,
+            'max': maximum,
+            'stddev': math.sqrt(variance)
+        }
+
+
+class RollingAggregator:
+    # 여러 센서 키 x 여러 구간의 RollingWindow를 한꺼번에 관리
+    def __init__(self, keys, windows=None, buckets=DEFAULT_BUCKETS):
+        self.windows = dict(windows or DEFAULT_WINDOWS)
+        self.rolling = {
+            key: {name: RollingWindow(seconds, buckets) for name, seconds in self.windows.items()}
+            for key in keys
+        }
+
+    def update(self, values, timestamp=None):
+        # 측정값 딕셔너리 하나를 모든 구간에 반영
+        if timestamp is None:
+            timestamp = time.time()
+        for key, value in values.items():
+            windows = self.rolling.get(key)
+            if windows is None:
+                continue
+            for window in windows.values():
+                window.add(value, timestamp)
+
+    def get_stats(self, window_name, now=None):
+        # {키: {'count', 'mean', 'min', 'max', 'stddev'}} 형태로 반환 (값이 없는 키는 제외)
+        if now is None:
+            now = time.time()
+        stats = {}
+        for key, windows in self.rolling.items():
+            key_stats = windows[window_name].get_stats(now)
+            if key_stats is not None:
+                stats[key] = key_stats
+        return stats
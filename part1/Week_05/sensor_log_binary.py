@@ -0,0 +1,143 @@
+# sensor_log_binary.py
+# 센서 로그를 고정 크기 이진 레코드로 저장/재생하는 모듈
+#
+# 파일 구조 (little-endian)
+#   [헤더 16바이트] magic 'MSLG' | 버전(H) | 레코드 크기(H) | 예약(Q)
+#   [레코드 32바이트 x N] timestamp_ns(int64) | DummySensor.env_values의 6개 값(float32, 키 순서 동일)
+#
+# 텍스트 로그('18°C, 17°C, 53%' 형식)처럼 문자열을 다시 파싱할 필요 없이,
+# NumPy memmap으로 파일 전체를 구조화 배열로 바로 열어서 분석할 수 있음
+#
+# 사용 예: python sensor_log_binary.py sensor_log.txt sensor_log.bin   (텍스트 로그 변환 후 재생 시간 출력)
+
+import os
+import re
+import struct
+import sys
+import time
+from datetime import datetime
+
+try:
+    import numpy as np  # 읽기(read_binary_log)에만 필요: pip install numpy
+except ImportError:
+    np = None
+
+SENSOR_KEYS = [
+    'mars_base_internal_temperature',
+    'mars_base_external_temperature',
+    'mars_base_internal_humidity',
+    'mars_base_external_illuminance',
+    'mars_base_internal_co2',
+    'mars_base_internal_oxygen'
+]
+MAGIC = b'MSLG'
+VERSION = 1
+HEADER_STRUCT = struct.Struct('<4sHHQ')
+RECORD_STRUCT = struct.Struct('<q' + 'f' * len(SENSOR_KEYS))
+TEXT_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+NUMBER_PATTERN = re.compile(r'-?\d+(?:\.\d+)?')
+CONVERT_BATCH_SIZE = 10000
+
+
+def get_record_dtype():
+    # RECORD_STRUCT와 같은 배치의 NumPy 구조화 dtype (패딩 없음, 32바이트)
+    return np.dtype([('timestamp_ns', '<i8')] + [(key, '<f4') for key in SENSOR_KEYS])
+
+
+def pack_header():
+    return HEADER_STRUCT.pack(MAGIC, VERSION, RECORD_STRUCT.size, 0)
+
+
+def pack_reading(timestamp_ns, env_values):
+    # 측정값 하나를 32바이트 레코드로 변환
+    return RECORD_STRUCT.pack(timestamp_ns, *(env_values[key] for key in SENSOR_KEYS))
+
+
+def write_header_if_needed(path):
+    # 새 파일이거나 빈 파일이면 헤더를 먼저 씀 (이어서 쓰는 경우는 그대로 둠)
+    if not os.path.isfile(path) or os.path.getsize(path) == 0:
+        with open(path, 'wb') as file:
+            file.write(pack_header())
+
+
+def read_binary_log(path):
+    # 이진 로그 전체를 memmap 구조화 배열로 반환 (필드 이름: timestamp_ns, SENSOR_KEYS)
+    if np is None:
+        raise ImportError('이진 로그를 읽으려면 numpy가 필요합니다: pip install numpy')
+    with open(path, 'rb') as file:
+        header = file.read(HEADER_STRUCT.size)
+    if len(header) < HEADER_STRUCT.size:
+        raise ValueError('센서 이진 로그 헤더가 없습니다.')
+    magic, version, record_size, _ = HEADER_STRUCT.unpack(header)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError('센서 이진 로그 형식이 아닙니다.')
+    dtype = get_record_dtype()
+    if record_size != dtype.itemsize:
+        raise ValueError('레코드 크기가 일치하지 않습니다.')
+    # 기록 중이라 끝이 잘린 레코드는 제외
+    count = (os.path.getsize(path) - HEADER_STRUCT.size) // record_size
+    if count == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='r', offset=HEADER_STRUCT.size, shape=(count,))
+
+
+def parse_text_log_line(line):
+    # '2025-04-09 17:11:51, 26°C, 17°C, 50%, 503 W/m2, 0.0337%, 4.31%' → (timestamp_ns, 값 딕셔너리)
+    # 형식이 맞지 않는 줄은 None
+    parts = line.strip().split(', ')
+    if len(parts) != len(SENSOR_KEYS) + 1:
+        return None
+    try:
+        timestamp = datetime.strptime(parts[0], TEXT_TIMESTAMP_FORMAT)
+        values = {}
+        for key, part in zip(SENSOR_KEYS, parts[1:]):
+            values[key] = float(NUMBER_PATTERN.match(part).group())
+    except (ValueError, AttributeError):
+        return None
+    return int(timestamp.timestamp()) * 1_000_000_000, values
+
+
+def convert_text_log(text_path, binary_path):
+    # 기존 텍스트 로그를 이진 로그로 변환하고, 변환한 레코드 수를 반환
+    count = 0
+    batch = []
+    with open(text_path, 'r', encoding='utf-8') as source, open(binary_path, 'wb') as target:
+        target.write(pack_header())
+        for line in source:
+            parsed = parse_text_log_line(line)
+            if parsed is None:
+                continue
+            batch.append(pack_reading(*parsed))
+            if len(batch) >= CONVERT_BATCH_SIZE:
+                target.write(b''.join(batch))
+                count += len(batch)
+                batch.clear()
+        target.write(b''.join(batch))
+        count += len(batch)
+    return count
+
+
+def main():
+    if len(sys.argv) != 3:
+        print('사용법: python sensor_log_binary.py <텍스트 로그> <이진 로그>')
+        return
+    text_path, binary_path = sys.argv[1], sys.argv[2]
+    try:
+        count = convert_text_log(text_path, binary_path)
+        print(f'변환 완료: {count}건 → {binary_path}')
+
+        start = time.perf_counter()
+        records = read_binary_log(binary_path)
+        averages = {key: float(records[key].mean()) for key in SENSOR_KEYS} if len(records) else {}
+        elapsed = time.perf_counter() - start
+        print(f'재생 및 평균 계산: {len(records)}건, {elapsed * 1000:.2f}ms')
+        for key, value in averages.items():
+            print(f'{key}: {round(value, 2)}')
+    except FileNotFoundError as e:
+        print('파일을 찾을 수 없습니다:', e.filename)
+    except Exception as e:
+        print('이진 로그 변환 중 오류 발생:', e)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,215 @@
+# sensor_shared_ring.py
+# 센서 측정값을 프로세스 사이에 주고받는 공유 메모리 링 버퍼 (multiprocessing.shared_memory)
+#
+# 측정 프로세스(생산자) 하나가 고정 크기 레코드를 쓰고, 평균 계산/로그 기록/화면 출력 같은
+# 소비자 프로세스 여러 개가 각자 읽은 위치를 기억하면서 같은 메모리를 직접 읽음
+# → 딕셔너리를 복사하거나 pickle로 직렬화하지 않고, 잠금(lock) 없이 넘겨줌
+#
+# 메모리 구조 (little-endian)
+#   [헤더 24바이트] magic 'MSRB' | 버전(H) | 레코드 크기(H) | 슬롯 수(I) | 예약(I) | 지금까지 쓴 개수(Q)
+#   [슬롯 40바이트 x 슬롯 수] 순번(Q) | 레코드(sensor_log_binary.RECORD_STRUCT, 32바이트)
+#   헤더와 슬롯 크기가 8의 배수라서 개수와 순번(8바이트)은 모두 8바이트 경계에 놓임
+#
+# 슬롯의 순번은 n번째 레코드를 쓰는 중이면 2n+1, 다 쓰면 2n+2 (seqlock 방식)
+# 소비자는 레코드 앞뒤로 순번을 확인해서, 읽는 도중 덮어써진 레코드는 버리고 놓친 개수로 셈
+#
+# 사용 예: python sensor_shared_ring.py   (생산자 1개 + 소비자 2개를 몇 초간 실행)
+
+import multiprocessing
+import struct
+import sys
+import time
+from multiprocessing import shared_memory
+
+from dummy_sensor import BufferedLogWriter, DummySensor
+from sensor_log_binary import RECORD_STRUCT, SENSOR_KEYS, write_header_if_needed
+
+MAGIC = b'MSRB'
+VERSION = 2
+HEADER_STRUCT = struct.Struct('<4sHHIIQ')
+COUNT_STRUCT = struct.Struct('<Q')
+COUNT_OFFSET = HEADER_STRUCT.size - COUNT_STRUCT.size
+SEQ_STRUCT = struct.Struct('<Q')
+SLOT_SIZE = SEQ_STRUCT.size + RECORD_STRUCT.size
+DEFAULT_CAPACITY = 4096
+CONSUMER_POLL_INTERVAL = 0.05  # 소비자가 새 레코드를 확인하는 간격 (초)
+
+
+class SensorRing:
+    # 생산자는 create()로 만들고, 소비자는 이름으로 attach()해서 같은 링 버퍼를 씀
+    def __init__(self, shm, capacity, owner):
+        self.shm = shm
+        self.buf = shm.buf
+        self.capacity = capacity
+        self.owner = owner  # 만든 쪽만 unlink()로 공유 메모리를 지움
+
+    @classmethod
+    def create(cls, capacity=DEFAULT_CAPACITY, name=None):
+        shm = shared_memory.SharedMemory(name=name, create=True, size=HEADER_STRUCT.size + SLOT_SIZE * capacity)
+        HEADER_STRUCT.pack_into(shm.buf, 0, MAGIC, VERSION, RECORD_STRUCT.size, capacity, 0, 0)
+        return cls(shm, capacity, owner=True)
+
+    @classmethod
+    def attach(cls, name):
+        shm = shared_memory.SharedMemory(name=name)
+        magic, version, record_size, capacity, _, _ = HEADER_STRUCT.unpack_from(shm.buf, 0)
+        if magic != MAGIC or version != VERSION or record_size != RECORD_STRUCT.size:
+            shm.close()
+            raise ValueError('센서 링 버퍼 형식이 아닙니다.')
+        return cls(shm, capacity, owner=False)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    @property
+    def write_count(self):
+        # 지금까지 쓴 레코드 개수 (= 다음에 쓸 레코드 번호)
+        return COUNT_STRUCT.unpack_from(self.buf, COUNT_OFFSET)[0]
+
+    def write(self, timestamp_ns, env_values):
+        # 레코드 하나를 씀 (생산자는 하나만 있어야 함)
+        # 가장 오래된 슬롯을 덮어쓰므로 느린 소비자가 있어도 생산자는 기다리지 않음
+        n = self.write_count
+        offset = HEADER_STRUCT.size + (n % self.capacity) * SLOT_SIZE
+        SEQ_STRUCT.pack_into(self.buf, offset, 2 * n + 1)
+        RECORD_STRUCT.pack_into(self.buf, offset + SEQ_STRUCT.size,
+                                timestamp_ns, *(env_values[key] for key in SENSOR_KEYS))
+        SEQ_STRUCT.pack_into(self.buf, offset, 2 * n + 2)
+        COUNT_STRUCT.pack_into(self.buf, COUNT_OFFSET, n + 1)
+
+    def read_since(self, position, max_count=None):
+        # position번 레코드부터 지금까지 쓴 레코드를 읽음
+        # 반환값: (레코드 튜플 리스트, 다음에 읽을 위치, 놓친 개수)
+        # 레코드 튜플은 (timestamp_ns, SENSOR_KEYS 순서의 값들)
+        end = self.write_count
+        dropped = 0
+        if end - position > self.capacity:
+            # 너무 늦어서 이미 덮어써진 레코드는 건너뜀
+            dropped = end - self.capacity - position
+            position = end - self.capacity
+        if max_count is not None:
+            end = min(end, position + max_count)
+        records = []
+        for n in range(position, end):
+            offset = HEADER_STRUCT.size + (n % self.capacity) * SLOT_SIZE
+            expected = 2 * n + 2
+            if SEQ_STRUCT.unpack_from(self.buf, offset)[0] != expected:
+                dropped += 1
+                continue
+            record = RECORD_STRUCT.unpack_from(self.buf, offset + SEQ_STRUCT.size)
+            # 읽는 도중 생산자가 같은 슬롯을 덮어썼으면 버림
+            if SEQ_STRUCT.unpack_from(self.buf, offset)[0] != expected:
+                dropped += 1
+                continue
+            records.append(record)
+        return records, end, dropped
+
+    def close(self):
+        self.buf = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def run_producer(ring_name, stop_event, interval):
+    # 측정 프로세스: DummySensor 값을 interval초마다 링 버퍼에 씀
+    ring = SensorRing.attach(ring_name)
+    sensor = DummySensor()
+    try:
+        while not stop_event.is_set():
+            sensor.set_env()
+            ring.write(time.time_ns(), sensor.env_values)
+            stop_event.wait(interval)
+    finally:
+        ring.close()
+
+
+def consume(ring_name, stop_event, handle_records):
+    # 소비자 공통 루프: 새 레코드를 모아서 handle_records(레코드 리스트)로 넘김
+    # 반환값: (처리한 개수, 놓친 개수)
+    ring = SensorRing.attach(ring_name)
+    position = ring.write_count
+    total = 0
+    total_dropped = 0
+    try:
+        while True:
+            stopping = stop_event.is_set()  # 종료 신호 뒤에 한 번 더 읽어서 남은 레코드까지 처리
+            records, position, dropped = ring.read_since(position)
+            total_dropped += dropped
+            if records:
+                handle_records(records)
+                total += len(records)
+            if stopping:
+                return total, total_dropped
+            time.sleep(CONSUMER_POLL_INTERVAL)
+    finally:
+        ring.close()
+
+
+def run_average_consumer(ring_name, stop_event):
+    # 평균 계산 프로세스: 읽은 레코드의 항목별 평균을 출력
+    sums = [0.0] * len(SENSOR_KEYS)
+
+    def add(records):
+        for record in records:
+            for i, value in enumerate(record[1:]):
+                sums[i] += value
+
+    count, dropped = consume(ring_name, stop_event, add)
+    print(f'[평균] {count}건 처리, {dropped}건 놓침')
+    if count:
+        for key, total in zip(SENSOR_KEYS, sums):
+            print(f'{key}: {round(total / count, 2)}')
+
+
+def run_log_consumer(ring_name, stop_event, binary_log_path):
+    # 로그 기록 프로세스: 읽은 레코드를 이진 센서 로그(sensor_log_binary.py 형식)에 이어서 씀
+    write_header_if_needed(binary_log_path)
+    writer = BufferedLogWriter(binary_log_path, binary=True)
+
+    def write(records):
+        for record in records:
+            writer.write(RECORD_STRUCT.pack(*record))
+
+    try:
+        count, dropped = consume(ring_name, stop_event, write)
+    finally:
+        writer.close()
+    print(f'[로그] {count}건 기록 → {binary_log_path}, {dropped}건 놓침')
+
+
+def main():
+    duration = float(sys.argv[1]) if len(sys.argv) > 1 else 3.0
+    interval = 0.01
+    ring = SensorRing.create()
+    # 생산자를 먼저 멈추고 나서 소비자를 멈춰야 마지막 레코드까지 읽힘
+    producer_stop = multiprocessing.Event()
+    consumer_stop = multiprocessing.Event()
+    consumers = [
+        multiprocessing.Process(target=run_average_consumer, args=(ring.name, consumer_stop)),
+        multiprocessing.Process(target=run_log_consumer, args=(ring.name, consumer_stop, 'sensor_log_ring.bin'))
+    ]
+    producer = multiprocessing.Process(target=run_producer, args=(ring.name, producer_stop, interval))
+    try:
+        for process in consumers:
+            process.start()
+        time.sleep(0.5)  # 소비자가 붙은 뒤에 측정 시작
+        producer.start()
+        time.sleep(duration)
+        producer_stop.set()
+        producer.join()
+        consumer_stop.set()
+        for process in consumers:
+            process.join()
+        print(f'생산자 기록: {ring.write_count}건')
+    except Exception as e:
+        print('링 버퍼 실행 중 오류 발생:', e)
+    finally:
+        producer_stop.set()
+        consumer_stop.set()
+        ring.close()
+
+
+if __name__ == '__main__':
+    main()
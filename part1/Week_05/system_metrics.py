@@ -0,0 +1,197 @@
+# system_metrics.py
+# 시스템 부하(CPU, 메모리, 디스크, 네트워크)를 백그라운드 스레드에서 주기적으로 측정해 두는 모듈
+#
+# psutil.cpu_percent(interval=1)처럼 호출할 때마다 1초씩 기다리지 않고,
+# 수집 스레드가 interval초마다 측정해서 링 버퍼(deque)에 쌓아두면 호출하는 쪽은 바로 꺼내 씀
+# 바뀌지 않는 시스템 정보(platform, os.cpu_count 등)는 처음 한 번만 조회해서 캐시함
+# 코어별 CPU 사용률, I/O 대기, 평균 부하(load average), CPU/메모리 상위 프로세스도 함께 측정해서
+# 어느 코어나 프로세스가 포화 상태인지 볼 수 있게 함
+
+import os
+import platform
+import threading
+import time
+from collections import deque
+
+import psutil
+
+METRICS_INTERVAL = 0.5  # 측정 간격 (초)
+METRICS_CAPACITY = 7200  # 링 버퍼에 보관할 측정 개수 (0.5초 간격이면 1시간)
+DISK_PATH = '/'
+TOP_PROCESS_COUNT = 5  # 부하가 큰 프로세스를 몇 개까지 보여줄지
+PROCESS_SAMPLE_EVERY = 4  # 프로세스 목록은 비용이 커서 측정 4번에 한 번만 갱신
+
+_static_info = None
+
+
+def get_static_info():
+    # 실행 중에 바뀌지 않는 시스템 정보는 처음 한 번만 조회
+    global _static_info
+    if _static_info is None:
+        _static_info = {
+            'os_name': platform.system(),
+            'os_version': platform.version(),
+            'cpu_type': platform.processor(),
+            'cpu_core_count': os.cpu_count(),
+            'memory_total': round(psutil.virtual_memory().total / (1024 ** 3), 2)  # GB
+        }
+    return dict(_static_info)
+
+
+def get_disk_path():
+    # Windows는 현재 드라이브의 루트(C:\ 등)를 사용
+    return os.path.abspath(os.sep) if platform.system() == 'Windows' else DISK_PATH
+
+
+class MetricsCollector:
+    # 사용 예:
+    #   collector = MetricsCollector(interval=0.5).start()
+    #   collector.latest()        → 가장 최근 측정값 딕셔너리
+    #   collector.average(60)     → 최근 60초 평균
+    #   collector.stop()
+    def __init__(self, interval=METRICS_INTERVAL, capacity=METRICS_CAPACITY, top_n=TOP_PROCESS_COUNT):
+        self.interval = interval
+        self.top_n = top_n
+        self.sample_count = 0
+        self.top_processes = ([], [])  # (CPU 상위, 메모리 상위) - 프로세스 목록을 다시 볼 때까지 재사용
+        self.samples = deque(maxlen=capacity)
+        self.lock = threading.Lock()
+        self.ready = threading.Event()  # 첫 측정값이 들어오면 설정됨
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.disk_path = get_disk_path()
+        self.last_counters = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        if self.thread is None:
+            # cpu_percent(interval=None)와 누적 카운터는 '이전 호출 이후' 기준이므로 먼저 기준점을 잡아둠
+            psutil.cpu_percent(interval=None)
+            psutil.cpu_percent(interval=None, percpu=True)
+            psutil.cpu_times_percent(interval=None)
+            self.read_top_processes()
+            self.last_counters = self.read_counters()
+            self.stop_event.clear()
+            self.thread = threading.Thread(target=self.run, daemon=True)
+            self.thread.start()
+        return self
+
+    def stop(self):
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+            # 다시 start()하면 latest()가 멈추기 전 측정값이 아니라 새 측정값을 기다리게 함
+            self.ready.clear()
+
+    def run(self):
+        # 시작 시각 기준으로 interval마다 측정해서 처리 시간만큼 간격이 밀리지 않게 함
+        next_time = time.monotonic()
+        while True:
+            next_time += self.interval
+            if self.stop_event.wait(max(0.0, next_time - time.monotonic())):
+                break
+            try:
+                sample = self.sample()
+            except Exception as e:
+                print(f'시스템 부하 측정 중 오류 발생: {e}')
+                continue
+            with self.lock:
+                self.samples.append(sample)
+            self.ready.set()
+
+    def read_counters(self):
+        # (측정 시각, 디스크 I/O 누적값, 네트워크 누적값) - 일부 환경에서는 None일 수 있음
+        return time.monotonic(), psutil.disk_io_counters(), psutil.net_io_counters()
+
+    def read_top_processes(self):
+        # CPU 사용률, 메모리(RSS) 기준 상위 top_n개 프로세스
+        # process_iter()는 Process 객체를 재사용하므로 cpu_percent는 직전 조회 이후의 사용률이 됨
+        processes = []
+        for process in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_info']):
+            info = process.info
+            if info['cpu_percent'] is None or info['memory_info'] is None:
+                continue  # 권한이 없거나 이미 종료된 프로세스
+            processes.append((info['pid'], info['name'], info['cpu_percent'], info['memory_info'].rss))
+        by_cpu = sorted(processes, key=lambda p: p[2], reverse=True)[:self.top_n]
+        by_rss = sorted(processes, key=lambda p: p[3], reverse=True)[:self.top_n]
+        return (
+            [{'pid': pid, 'name': name, 'cpu_percent': cpu} for pid, name, cpu, _ in by_cpu],
+            [{'pid': pid, 'name': name, 'rss_mb': round(rss / (1024 ** 2), 1)} for pid, name, _, rss in by_rss]
+        )
+
+    def sample(self):
+        # 측정값 하나를 만듦: 누적 카운터는 직전 측정과의 차이로 초당 바이트 수를 계산
+        now, disk, net = self.read_counters()
+        last_time, last_disk, last_net = self.last_counters
+        self.last_counters = (now, disk, net)
+        elapsed = max(now - last_time, 1e-9)
+
+        def rate(current, previous, field):
+            if current is None or previous is None:
+                return 0.0
+            return round(max(getattr(current, field) - getattr(previous, field), 0) / elapsed, 1)
+
+        if self.sample_count % PROCESS_SAMPLE_EVERY == 0:
+            self.top_processes = self.read_top_processes()
+        self.sample_count += 1
+        # iowait는 Linux에만 있음, getloadavg()는 Windows에서 psutil이 흉내 내며 처음 몇 초는 0
+        cpu_times = psutil.cpu_times_percent(interval=None)
+        load_1, load_5, load_15 = psutil.getloadavg()
+
+        return {
+            'timestamp': time.time(),
+            'cpu_usage_percent': psutil.cpu_percent(interval=None),
+            'cpu_per_core_percent': psutil.cpu_percent(interval=None, percpu=True),
+            'cpu_iowait_percent': getattr(cpu_times, 'iowait', 0.0),
+            'load_average_1min': round(load_1, 2),
+            'load_average_5min': round(load_5, 2),
+            'load_average_15min': round(load_15, 2),
+            'memory_usage_percent': psutil.virtual_memory().percent,
+            'disk_usage_percent': psutil.disk_usage(self.disk_path).percent,
+            'disk_read_bytes_per_sec': rate(disk, last_disk, 'read_bytes'),
+            'disk_write_bytes_per_sec': rate(disk, last_disk, 'write_bytes'),
+            'net_sent_bytes_per_sec': rate(net, last_net, 'bytes_sent'),
+            'net_recv_bytes_per_sec': rate(net, last_net, 'bytes_recv'),
+            'top_cpu_processes': self.top_processes[0],
+            'top_memory_processes': self.top_processes[1]
+        }
+
+    def latest(self, timeout=None):
+        # 가장 최근 측정값 (timestamp 포함)
+        # 아직 측정값이 없으면 timeout초까지만 첫 측정을 기다리고, 그래도 없으면 None
+        if not self.ready.wait(timeout):
+            return None
+        with self.lock:
+            return dict(self.samples[-1])
+
+    def average(self, window_seconds):
+        # 최근 window_seconds초 동안의 측정값 평균 (timestamp는 가장 최근 측정 시각)
+        # 코어별 사용률은 코어마다 평균, 상위 프로세스 목록은 가장 최근 값을 그대로 사용
+        # 해당 구간에 측정값이 없으면 None
+        since = time.time() - window_seconds
+        window = []
+        with self.lock:
+            # 링 버퍼는 시간순이므로 최근 것부터 보다가 구간을 벗어나면 멈춤
+            for sample in reversed(self.samples):
+                if sample['timestamp'] < since:
+                    break
+                window.append(sample)
+        if not window:
+            return None
+        averages = {'timestamp': window[0]['timestamp']}
+        for key, value in window[0].items():
+            if key == 'timestamp':
+                continue
+            if isinstance(value, (int, float)):
+                averages[key] = round(sum(sample[key] for sample in window) / len(window), 2)
+            elif key == 'cpu_per_core_percent':
+                averages[key] = [round(sum(core) / len(window), 2) for core in zip(*(sample[key] for sample in window))]
+            else:
+                averages[key] = value
+        return averages
@@ -0,0 +1,263 @@
+# benchmark_log_tools.py
+# part1 로그 도구(Week_01/main.py, mission_02/mission_log_analyzer.py)의 처리량과 최대 메모리(RSS)를 측정하는 스크립트
+#
+# 사용 예:
+#   python benchmark_log_tools.py --sizes 10MB              # 10MB 로그만 측정
+#   python benchmark_log_tools.py --output bench.json        # 10MB, 1GB, 10GB 모두 측정해서 JSON 저장
+#
+# 각 측정은 별도 프로세스에서 실행해서 최대 RSS가 서로 섞이지 않도록 함
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import multiprocessing
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+try:
+    import resource  # Windows에는 없음 → RSS는 null로 기록
+except ImportError:
+    resource = None
+
+PART1_DIR = os.path.dirname(os.path.abspath(__file__))
+WEEK_01_PATH = os.path.join(PART1_DIR, 'Week_01', 'main.py')
+MISSION_02_PATH = os.path.join(PART1_DIR, 'mission_02', 'mission_log_analyzer.py')
+SAMPLE_LOG_PATH = os.path.join(PART1_DIR, 'mission_02', 'mission_computer_main.log')
+
+SIZE_UNITS = {'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3}
+DEFAULT_SIZES = ['10MB', '1GB', '10GB']
+EVENTS = ['INFO'] * 8 + ['WARNING', 'ERROR']
+SEARCH_KEYWORD = 'oxygen'
+
+
+def parse_size(text):
+    text = text.strip().upper()
+    for unit, factor in SIZE_UNITS.items():
+        if text.endswith(unit):
+            return int(float(text[:-len(unit)]) * factor)
+    return int(text)
+
+
+def load_module(name, path):
+    # 두 폴더의 스크립트를 패키지 없이 파일 경로로 불러옴
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_sample_messages():
+    messages = []
+    with open(SAMPLE_LOG_PATH, 'r', encoding='utf-8') as file:
+        next(file)
+        for line in file:
+            parts = line.strip().split(',')
+            if len(parts) == 3:
+                messages.append(parts[2])
+    return messages
+
+
+def generate_log(path, target_bytes, seed=0):
+    # 기존 'timestamp,event,message' 형식으로 target_bytes 크기의 가짜 로그를 생성
+    rng = random.Random(seed)
+    messages = load_sample_messages()
+    timestamp = datetime(2023, 8, 27, 10, 0, 0)
+    written = 0
+    lines = 0
+    with open(path, 'w', encoding='utf-8', buffering=1024 * 1024) as file:
+        header = 'timestamp,event,message\n'
+        file.write(header)
+        written += len(header)
+        while written < target_bytes:
+            timestamp += timedelta(seconds=rng.randint(0, 3))
+            line = f"{timestamp.strftime('%Y-%m-%d %H:%M:%S')},{rng.choice(EVENTS)},{rng.choice(messages)}\n"
+            file.write(line)
+            written += len(line.encode('utf-8'))
+            lines += 1
+    return lines
+
+
+def get_log_file(data_dir, size_text):
+    # 같은 크기의 로그가 이미 있으면 다시 만들지 않음
+    target_bytes = parse_size(size_text)
+    path = os.path.join(data_dir, f'mission_computer_main_{size_text}.log')
+    meta_path = path + '.meta'
+    if os.path.isfile(path) and os.path.isfile(meta_path):
+        with open(meta_path, 'r', encoding='utf-8') as file:
+            meta = json.load(file)
+        if meta.get('target_bytes') == target_bytes:
+            return path, meta['lines']
+    print(f'[{size_text}] 테스트 로그 생성 중: {path}', file=sys.stderr)
+    lines = generate_log(path, target_bytes)
+    with open(meta_path, 'w', encoding='utf-8') as file:
+        json.dump({'target_bytes': target_bytes, 'lines': lines}, file)
+    return path, lines
+
+
+# 측정 대상: 이름 → (준비 함수, 측정 함수)
+# 준비 단계(예: 정렬 전 로그 읽기)는 시간에서 제외하지만 RSS에는 포함됨
+
+def bench_week01_read_log_file(path):
+    week01 = load_module('week01_main', WEEK_01_PATH)
+    return lambda: sum(1 for _ in week01.read_log_file(path))
+
+
+def bench_week01_analyze_logs(path):
+    week01 = load_module('week01_main', WEEK_01_PATH)
+    matcher = week01.compile_rules(week01.DEFAULT_RULES)
+    return lambda: sum(1 for _ in week01.analyze_logs(week01.read_log_file(path), matcher))
+
+
+def bench_read_log_file(path):
+    analyzer = load_module('mission_log_analyzer', MISSION_02_PATH)
+    return lambda: len(analyzer.read_log_file(path))
+
+
+def bench_sort_logs_desc(path):
+    analyzer = load_module('mission_log_analyzer', MISSION_02_PATH)
+    logs = analyzer.read_log_file(path)
+    return lambda: len(analyzer.sort_logs_desc(logs))
+
+
+def bench_sort_log_file_desc(path):
+    analyzer = load_module('mission_log_analyzer', MISSION_02_PATH)
+    return lambda: sum(1 for _ in analyzer.sort_log_file_desc(path))
+
+
+def bench_logs_to_dict(path):
+    analyzer = load_module('mission_log_analyzer', MISSION_02_PATH)
+    logs = analyzer.read_log_file(path)
+    return lambda: len(analyzer.logs_to_dict(logs))
+
+
+def bench_search_keyword(path):
+    analyzer = load_module('mission_log_analyzer', MISSION_02_PATH)
+    logs = analyzer.read_log_file(path)
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):  # 검색 결과 출력은 측정에서 제외
+            analyzer.search_keyword(logs, SEARCH_KEYWORD)
+        return len(logs)
+    return run
+
+
+def bench_search_keyword_indexed(path):
+    analyzer = load_module('mission_log_analyzer', MISSION_02_PATH)
+    index = analyzer.build_log_index(path)  # 인덱스 생성은 준비 단계
+    return lambda: len(analyzer.search_keyword_indexed(path, index, SEARCH_KEYWORD))
+
+
+BENCHMARKS = {
+    'week01.read_log_file': bench_week01_read_log_file,
+    'week01.analyze_logs': bench_week01_analyze_logs,
+    'mission_02.read_log_file': bench_read_log_file,
+    'mission_02.sort_logs_desc': bench_sort_logs_desc,
+    'mission_02.sort_log_file_desc': bench_sort_log_file_desc,
+    'mission_02.logs_to_dict': bench_logs_to_dict,
+    'mission_02.search_keyword': bench_search_keyword,
+    'mission_02.search_keyword_indexed': bench_search_keyword_indexed,
+}
+
+
+def get_peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # 리눅스는 KB, macOS는 바이트 단위
+    divisor = 1024 * 1024 if platform.system() == 'Darwin' else 1024
+    return round(peak / divisor, 1)
+
+
+def run_in_child(name, path, queue):
+    try:
+        run = BENCHMARKS[name](path)
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        queue.put({'seconds': elapsed, 'peak_rss_mb': get_peak_rss_mb()})
+    except MemoryError:
+        queue.put({'error': 'MemoryError', 'peak_rss_mb': get_peak_rss_mb()})
+    except Exception as e:
+        queue.put({'error': f'{type(e).__name__}: {e}', 'peak_rss_mb': get_peak_rss_mb()})
+
+
+def run_benchmark(name, size_text, path, file_bytes, lines):
+    queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=run_in_child, args=(name, path, queue))
+    process.start()
+    process.join()
+    result = {'name': name, 'size': size_text, 'file_bytes': file_bytes, 'lines': lines}
+    if queue.empty():
+        # 메모리 부족으로 강제 종료된 경우 등
+        result['error'] = f'process exited with code {process.exitcode}'
+        return result
+    measured = queue.get()
+    result.update(measured)
+    if 'seconds' in measured and measured['seconds'] > 0:
+        result['mb_per_sec'] = round(file_bytes / (1024 ** 2) / measured['seconds'], 2)
+        result['lines_per_sec'] = round(lines / measured['seconds'])
+        result['seconds'] = round(measured['seconds'], 4)
+    return result
+
+
+def get_git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=PART1_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='part1 로그 도구 벤치마크')
+    parser.add_argument('--sizes', nargs='+', default=DEFAULT_SIZES,
+                        help='생성할 테스트 로그 크기 (예: 10MB 1GB 10GB)')
+    parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARKS), default=list(BENCHMARKS),
+                        help='측정할 항목만 선택')
+    parser.add_argument('--data-dir', default=os.path.join(tempfile.gettempdir(), 'mission_log_bench'),
+                        help='테스트 로그를 저장할 폴더 (다음 실행 때 재사용)')
+    parser.add_argument('--output', help='결과 JSON을 저장할 파일 (없으면 화면에 출력)')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    os.makedirs(args.data_dir, exist_ok=True)
+
+    report = {
+        'commit': get_git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'created_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'results': [],
+    }
+    for size_text in args.sizes:
+        path, lines = get_log_file(args.data_dir, size_text)
+        file_bytes = os.path.getsize(path)
+        for name in args.only:
+            print(f'[{size_text}] {name} 측정 중...', file=sys.stderr)
+            report['results'].append(run_benchmark(name, size_text, path, file_bytes, lines))
+        # search_keyword_indexed가 만든 인덱스는 다음 측정을 위해 지움
+        if os.path.isfile(path + '.idx'):
+            os.remove(path + '.idx')
+
+    text = json.dumps(report, indent=4, ensure_ascii=False)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            file.write(text + '\n')
+        print(f'결과 저장 완료 → {args.output}', file=sys.stderr)
+    else:
+        print(text)
+
+
+if __name__ == '__main__':
+    main()
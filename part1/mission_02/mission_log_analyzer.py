@@ -1,4 +1,29 @@
+import hashlib
+import heapq
 import json
+import mmap
+import operator
+import os
+import re
+import struct
+import tempfile
+from array import array
+from bisect import bisect_left
+from datetime import datetime, timezone
+from itertools import accumulate, compress, islice
+
+INDEX_SUFFIX = '.idx'
+INDEX_MAGIC = b'MLIX'
+INDEX_VERSION = 2
+# magic | 버전 | 인덱싱한 바이트 수 | 로그 파일 크기 | inode | mtime(ns) | 앞부분 해시 | 끝부분 해시 | 토큰 수 | 토큰 목록 바이트 수
+INDEX_HEADER = struct.Struct('<4sHQQQq16s16sQQ')
+IDENTITY_BYTES = 4096  # 로그가 바뀌었는지 확인할 때 해시를 계산할 앞/끝 부분 크기
+TOKEN_PATTERN = re.compile(r'[0-9a-z]+')
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+WRITE_BUFFER_SIZE = 1024 * 1024
+RUN_SIZE = 100000  # 외부 정렬 시 메모리에서 한 번에 정렬할 로그 수
+MERGE_FAN_IN = 64  # 외부 정렬 시 한 번에 열어서 합칠 run 파일 수 (파일 디스크립터 한도 대비)
+READ_CHUNK_SIZE = 64 * 1024  # 파일을 거꾸로 읽을 때 한 번에 읽을 바이트 수
 
 def read_log_file(filename):
     """로그 파일을 읽어 리스트로 반환합니다.
@@ -29,6 +54,169 @@ def sort_logs_desc(logs):
     return sorted(logs, key=lambda x: x[0], reverse=True)
 
 
+def iter_log_file(filename):
+    """read_log_file()과 같은 규칙으로 로그를 한 줄씩 넘겨주는 제너레이터입니다."""
+    try:
+        with open(filename, 'r', encoding='utf-8') as file:
+            next(file, None)  # 헤더 무시
+            for line in file:
+                parts = line.strip().split(',')
+                if len(parts) == 3:
+                    yield parts
+    except FileNotFoundError:
+        print('[오류] 파일이 존재하지 않습니다.')
+    except Exception as e:
+        print('[오류] 파일 읽기 중 예외 발생:', e)
+
+
+def iter_log_file_reversed(filename, chunk_size=READ_CHUNK_SIZE):
+    """파일 끝에서부터 거꾸로 읽어 로그를 마지막 줄부터 넘겨주는 제너레이터입니다.
+
+    파일의 첫 줄(헤더)은 넘겨주지 않습니다.
+    """
+    try:
+        with open(filename, 'rb') as file:
+            file.seek(0, os.SEEK_END)
+            position = file.tell()
+            remainder = b''
+            while position > 0:
+                read_size = min(chunk_size, position)
+                position -= read_size
+                file.seek(position)
+                parts = (file.read(read_size) + remainder).split(b'\n')
+                remainder = parts[0]  # 이전 청크와 이어질 수 있는 앞부분은 다음으로 넘김
+                for raw_line in reversed(parts[1:]):
+                    row = parse_log_row(raw_line)
+                    if row is not None:
+                        yield row
+            # 마지막으로 남은 remainder는 파일의 첫 줄(헤더)이므로 무시
+    except FileNotFoundError:
+        print('[오류] 파일이 존재하지 않습니다.')
+    except Exception as e:
+        print('[오류] 파일 읽기 중 예외 발생:', e)
+
+
+def reverse_keep_ties(logs):
+    """역순으로 들어온 로그에서 같은 시각의 로그끼리는 원래 순서로 되돌려 넘겨줍니다.
+
+    sorted(..., reverse=True)는 같은 시각의 로그 순서를 유지하므로, 거꾸로 읽은 결과를
+    sort_logs_desc()와 똑같이 맞추기 위해 사용합니다.
+    """
+    group = []
+    for log in logs:
+        if group and log[0] != group[0][0]:
+            yield from reversed(group)
+            group = []
+        group.append(log)
+    yield from reversed(group)
+
+
+def write_sorted_run(logs, temp_dir):
+    """정렬된 로그 묶음 하나(run)를 임시 파일에 JSON Lines로 저장하고 경로를 반환합니다."""
+    fd, path = tempfile.mkstemp(suffix='.run', dir=temp_dir)
+    with os.fdopen(fd, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        for log in logs:
+            f.write(json.dumps(log, ensure_ascii=False))
+            f.write('\n')
+    return path
+
+
+def read_sorted_run(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            yield json.loads(line)
+
+
+def next_run(logs, run_size):
+    """iterator에서 최대 run_size개의 로그를 꺼내 리스트로 반환합니다."""
+    run = []
+    for log in logs:
+        run.append(log)
+        if len(run) >= run_size:
+            break
+    return run
+
+
+def merge_runs(paths):
+    """run 파일들을 열어 시간 역순으로 합쳐서 넘겨주는 제너레이터입니다.
+
+    heapq.merge는 같은 키일 때 앞 run의 로그를 먼저 내보내므로 안정 정렬이 유지됩니다.
+    """
+    runs = [read_sorted_run(path) for path in paths]
+    return heapq.merge(*runs, key=lambda x: x[0], reverse=True)
+
+
+def reduce_runs(paths, run_dir, fan_in=MERGE_FAN_IN):
+    """run 파일이 fan_in개 이하가 될 때까지 이웃한 fan_in개씩 합쳐 새 run 파일로 만듭니다.
+
+    한 번에 여는 파일 수가 fan_in개를 넘지 않으므로 run이 아무리 많아도
+    'Too many open files' 오류가 나지 않습니다. 이웃한 run끼리 순서대로 합치므로
+    같은 시각의 로그 순서도 그대로 유지됩니다.
+    """
+    while len(paths) > fan_in:
+        merged = []
+        for i in range(0, len(paths), fan_in):
+            group = paths[i:i + fan_in]
+            if len(group) == 1:
+                merged.append(group[0])
+                continue
+            merged.append(write_sorted_run(merge_runs(group), run_dir))
+            for path in group:
+                os.remove(path)
+        paths = merged
+    return paths
+
+
+def external_sort_desc(logs, run_size=RUN_SIZE, temp_dir=None, fan_in=MERGE_FAN_IN):
+    """메모리에 다 들어가지 않는 로그를 시간 역순으로 정렬해서 넘겨주는 제너레이터입니다.
+
+    run_size개씩 메모리에서 정렬해 임시 파일(run)로 내보낸 뒤 heapq.merge로 합칩니다.
+    run이 fan_in개보다 많으면 fan_in개씩 여러 단계로 나눠 합칩니다.
+    로그가 run 하나에 다 들어가면 임시 파일 없이 메모리에서 정렬합니다.
+    결과 순서는 sort_logs_desc()와 같습니다 (같은 시각은 원래 순서 유지).
+
+    Args:
+        logs (iterable): [timestamp, event, message] 형태의 로그를 넘겨주는 iterable
+        run_size (int): 한 번에 메모리에서 정렬할 로그 수
+        temp_dir (str | None): 임시 파일을 만들 폴더 (None이면 시스템 기본 폴더)
+        fan_in (int): 한 번에 열어서 합칠 run 파일 수 (2 이상)
+    """
+    logs = iter(logs)
+    run = sort_logs_desc(next_run(logs, run_size))
+    if len(run) < run_size:
+        yield from run
+        return
+
+    with tempfile.TemporaryDirectory(dir=temp_dir) as run_dir:
+        paths = []
+        while run:
+            paths.append(write_sorted_run(run, run_dir))
+            run = sort_logs_desc(next_run(logs, run_size))
+        yield from merge_runs(reduce_runs(paths, run_dir, fan_in))
+
+
+def is_sorted_asc(logs):
+    """로그가 이미 시간순(오름차순)으로 정렬되어 있는지 한 번 훑어서 확인합니다."""
+    previous = None
+    for log in logs:
+        if previous is not None and log[0] < previous:
+            return False
+        previous = log[0]
+    return True
+
+
+def sort_log_file_desc(filename, run_size=RUN_SIZE, temp_dir=None, fan_in=MERGE_FAN_IN):
+    """로그 파일을 메모리에 모두 올리지 않고 시간 역순으로 넘겨주는 제너레이터입니다.
+
+    이미 시간순으로 기록된 로그(일반적인 경우)는 정렬 없이 파일을 거꾸로 읽기만 하고,
+    그렇지 않으면 external_sort_desc()로 외부 정렬합니다.
+    """
+    if is_sorted_asc(iter_log_file(filename)):
+        yield from reverse_keep_ties(iter_log_file_reversed(filename))
+    else:
+        yield from external_sort_desc(iter_log_file(filename), run_size, temp_dir, fan_in)
+
+
 def logs_to_dict(logs):
     """로그 리스트를 딕셔너리로 변환합니다."""
     return {
@@ -50,6 +238,54 @@ def save_json(data, filename):
         print('[오류] JSON 저장 실패:', e)
 
 
+def iter_log_records(logs):
+    """logs_to_dict()와 같은 (키, 레코드) 쌍을 하나씩 넘겨주는 제너레이터입니다."""
+    for i, log in enumerate(logs):
+        yield str(i), {'timestamp': log[0], 'event': log[1], 'message': log[2]}
+
+
+def save_json_stream(logs, filename, indent=4):
+    """로그를 딕셔너리로 모으지 않고 레코드 단위로 바로 JSON 파일에 씁니다.
+
+    indent=4이면 save_json(logs_to_dict(logs))와 같은 내용이 저장되고,
+    indent=None이면 들여쓰기 없이 한 줄로 저장합니다.
+
+    Args:
+        logs (iterable): [timestamp, event, message] 형태의 로그를 넘겨주는 iterable
+        filename (str): 저장할 파일 경로
+        indent (int | None): 들여쓰기 칸 수
+    """
+    try:
+        with open(filename, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write('{')
+            first = True
+            for key, record in iter_log_records(logs):
+                value = json.dumps(record, indent=indent, ensure_ascii=False)
+                if indent is None:
+                    f.write(('' if first else ', ') + json.dumps(key) + ': ' + value)
+                else:
+                    pad = ' ' * indent
+                    value = value.replace('\n', '\n' + pad)
+                    f.write((',\n' if not first else '\n') + pad + json.dumps(key) + ': ' + value)
+                first = False
+            if not first and indent is not None:
+                f.write('\n')
+            f.write('}')
+    except Exception as e:
+        print('[오류] JSON 저장 실패:', e)
+
+
+def save_json_lines(logs, filename):
+    """로그를 한 줄에 레코드 하나씩 JSON Lines 형식으로 저장합니다."""
+    try:
+        with open(filename, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            for _, record in iter_log_records(logs):
+                f.write(json.dumps(record, ensure_ascii=False))
+                f.write('\n')
+    except Exception as e:
+        print('[오류] JSON Lines 저장 실패:', e)
+
+
 def search_keyword(logs, keyword):
     """키워드를 포함한 로그 메시지를 출력합니다."""
     print(f'\n🔍 "{keyword}" 포함 로그:')
@@ -62,31 +298,447 @@ def search_keyword(logs, keyword):
         print('→ 해당 키워드를 포함한 로그가 없습니다.')
 
 
+def tokenize(text):
+    """문자열을 소문자 영숫자 토큰 리스트로 나눕니다."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def get_index_filename(log_file):
+    """로그 파일 옆에 저장할 인덱스 파일 경로를 반환합니다."""
+    return log_file + INDEX_SUFFIX
+
+
+def parse_log_row(raw_line):
+    """바이트 한 줄을 read_log_file()과 같은 규칙으로 [timestamp, event, message]로 나눕니다.
+
+    Returns:
+        list | None: 필드가 3개가 아니면 None
+    """
+    parts = raw_line.decode('utf-8').strip().split(',')
+    return parts if len(parts) == 3 else None
+
+
+def index_log_lines(mm, start, postings):
+    """mmap의 start 위치부터 완성된 줄들을 읽어 postings(토큰 → 줄 시작 위치)에 추가합니다.
+
+    Args:
+        mm (mmap.mmap): 메모리 매핑된 로그 파일
+        start (int): 인덱싱을 시작할 바이트 위치 (0이면 헤더를 건너뜀)
+        postings (dict): 갱신할 역색인
+
+    Returns:
+        int: 인덱싱을 마친 위치 (개행 문자가 없는 마지막 줄은 제외)
+    """
+    position = start
+    size = len(mm)
+    while position < size:
+        end = mm.find(b'\n', position)
+        if end == -1:
+            break  # 아직 기록 중인 마지막 줄은 다음에 인덱싱
+        if position != 0:  # 헤더 무시
+            row = parse_log_row(mm[position:end])
+            if row is not None:
+                for token in set(tokenize(row[2])):
+                    postings.setdefault(token, array('q')).append(position)
+        position = end + 1
+    return position
+
+
+def get_log_digests(mm, log_size):
+    """인덱싱한 범위(0 ~ log_size)의 앞부분과 끝부분 해시를 반환합니다.
+
+    로그에 줄이 덧붙기만 했다면 두 해시가 그대로이므로, 다른 파일로 바뀌었는지 구분할 수 있습니다.
+    """
+    head = hashlib.blake2b(mm[:min(IDENTITY_BYTES, log_size)], digest_size=16).digest()
+    tail = hashlib.blake2b(mm[max(0, log_size - IDENTITY_BYTES):log_size], digest_size=16).digest()
+    return head, tail
+
+
+class LogIndex:
+    """'<로그 파일>.idx'에 저장된 역색인입니다.
+
+    파일 구조
+    - 헤더 (INDEX_HEADER): 인덱싱한 범위와 로그 파일 식별 정보(inode, mtime, 앞/끝부분 해시)
+    - 토큰별 줄 위치 개수 (array('q'))
+    - 토큰 목록 ('\n'으로 이어 붙인 문자열)
+    - 토큰 순서대로 이어 붙인 줄 시작 위치 (array('q'))
+
+    load()는 헤더와 토큰 목록만 읽고, 줄 위치는 검색할 때 필요한 토큰만 파일에서 읽습니다.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.log_size = 0
+        self.file_size = 0
+        self.inode = 0
+        self.mtime_ns = 0
+        self.head_digest = b''
+        self.tail_digest = b''
+        self.vocabulary = {}  # 토큰 → (줄 위치 시작 번호, 개수)
+        self.data_offset = 0
+
+    @classmethod
+    def load(cls, path):
+        """인덱스 파일의 헤더와 토큰 목록을 읽습니다. 형식이 다르면 ValueError를 냅니다."""
+        index = cls(path)
+        with open(path, 'rb') as f:
+            header = f.read(INDEX_HEADER.size)
+            if len(header) < INDEX_HEADER.size:
+                raise ValueError('인덱스 헤더가 없습니다.')
+            (magic, version, index.log_size, index.file_size, index.inode, index.mtime_ns,
+             index.head_digest, index.tail_digest, token_count, tokens_size) = INDEX_HEADER.unpack(header)
+            if magic != INDEX_MAGIC or version != INDEX_VERSION:
+                raise ValueError('인덱스 형식이 아닙니다.')
+            counts = array('q')
+            counts.frombytes(f.read(token_count * counts.itemsize))
+            tokens = f.read(tokens_size).decode('utf-8').split('\n') if token_count else []
+            if len(counts) != token_count or len(tokens) != token_count:
+                raise ValueError('인덱스 파일이 잘렸습니다.')
+            index.data_offset = f.tell()
+        starts = accumulate(counts, initial=0)
+        index.vocabulary = dict(zip(tokens, zip(starts, counts)))
+        return index
+
+    def is_current(self, stat):
+        """로그 파일이 인덱싱한 뒤로 바뀌지 않았는지 파일 정보(os.stat)만으로 확인합니다."""
+        return (self.inode == stat.st_ino and self.mtime_ns == stat.st_mtime_ns
+                and self.file_size == stat.st_size)
+
+    def is_prefix_of(self, mm, stat):
+        """로그 파일이 인덱싱한 내용 뒤에 줄이 덧붙기만 한 같은 파일인지 확인합니다."""
+        return (self.inode == stat.st_ino and self.log_size <= len(mm)
+                and get_log_digests(mm, self.log_size) == (self.head_digest, self.tail_digest))
+
+    def read_postings(self, tokens):
+        """tokens 각각의 줄 시작 위치 배열을 인덱스 파일에서 읽어 넘겨주는 제너레이터입니다."""
+        if not tokens:
+            return
+        with open(self.path, 'rb') as f:
+            for token in tokens:
+                start, count = self.vocabulary[token]
+                offsets = array('q')
+                f.seek(self.data_offset + start * offsets.itemsize)
+                offsets.frombytes(f.read(count * offsets.itemsize))
+                yield offsets
+
+    def read_all_postings(self):
+        """이어서 인덱싱할 수 있도록 전체 역색인을 {토큰: array('q')}로 읽습니다."""
+        tokens = list(self.vocabulary)
+        return dict(zip(tokens, self.read_postings(tokens)))
+
+
+def save_log_index(index_file, postings, log_size, stat, digests):
+    """역색인을 LogIndex 형식으로 저장합니다. 임시 파일에 쓴 뒤 교체하므로 중간에 실패해도 기존 인덱스는 유지됩니다."""
+    tokens = sorted(postings)
+    counts = array('q', [len(postings[token]) for token in tokens])
+    token_bytes = '\n'.join(tokens).encode('utf-8')
+    temp_file = index_file + '.tmp'
+    with open(temp_file, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, log_size, stat.st_size, stat.st_ino,
+                                  stat.st_mtime_ns, digests[0], digests[1], len(tokens), len(token_bytes)))
+        f.write(counts.tobytes())
+        f.write(token_bytes)
+        for token in tokens:
+            offsets = postings[token]
+            f.write((offsets if isinstance(offsets, array) else array('q', offsets)).tobytes())
+    os.replace(temp_file, index_file)
+
+
+def build_log_index(log_file):
+    """로그 파일의 역색인을 만들거나, 로그가 늘어났으면 늘어난 부분만 추가합니다.
+
+    인덱스는 '<로그 파일>.idx'에 이진 형식(LogIndex)으로 저장됩니다.
+    로그 파일이 그대로면(inode, mtime, 크기) 저장된 인덱스를 바로 쓰고,
+    줄이 덧붙기만 했으면(inode, 앞/끝부분 해시) 늘어난 부분만 인덱싱하고,
+    그 밖의 경우(교체, 수정)에는 처음부터 다시 만듭니다.
+
+    Args:
+        log_file (str): 로그 파일 경로
+
+    Returns:
+        LogIndex: 검색에 사용할 인덱스 (오류가 나면 빈 인덱스)
+    """
+    index_file = get_index_filename(log_file)
+    index = None
+    try:
+        index = LogIndex.load(index_file)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print('[오류] 인덱스 읽기 실패, 새로 만듭니다:', e)
+
+    try:
+        stat = os.stat(log_file)
+        if index is not None and index.is_current(stat):
+            return index
+        if stat.st_size == 0:
+            return LogIndex()
+        postings = {}
+        start = 0
+        with open(log_file, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if index is not None and index.is_prefix_of(mm, stat):
+                    postings = index.read_all_postings()
+                    start = index.log_size
+                log_size = index_log_lines(mm, start, postings)
+                digests = get_log_digests(mm, log_size)
+        save_log_index(index_file, postings, log_size, stat, digests)
+        return LogIndex.load(index_file)
+    except FileNotFoundError:
+        print('[오류] 파일이 존재하지 않습니다.')
+    except Exception as e:
+        print('[오류] 인덱스 생성 중 예외 발생:', e)
+    return LogIndex()
+
+
+def find_candidate_offsets(index, keyword):
+    """키워드의 각 토큰을 포함하는 인덱스 토큰들로 후보 줄 위치를 좁힙니다.
+
+    Returns:
+        set | None: 후보 줄 위치 집합, 키워드에 토큰이 없으면 None (전체 검사 필요)
+    """
+    query_tokens = tokenize(keyword)
+    if not query_tokens:
+        return None
+    candidates = None
+    for query_token in set(query_tokens):
+        # 부분 문자열 검색('max' → 'maximum')을 유지하기 위해 토큰 목록에서 포함 여부를 확인
+        tokens = [token for token in index.vocabulary if query_token in token]
+        offsets = set()
+        for token_offsets in index.read_postings(tokens):
+            offsets.update(token_offsets)
+        candidates = offsets if candidates is None else candidates & offsets
+        if not candidates:
+            break
+    return candidates
+
+
+def search_keyword_indexed(log_file, index, keyword):
+    """역색인으로 후보 줄만 mmap에서 읽어 키워드를 포함한 로그를 시간 역순으로 반환합니다.
+
+    Args:
+        log_file (str): 로그 파일 경로
+        index (LogIndex): build_log_index()가 반환한 인덱스
+        keyword (str): 검색할 키워드
+
+    Returns:
+        list: [["timestamp", "event", "message"], ...] 형태의 리스트
+    """
+    keyword_lower = keyword.lower()
+    candidates = find_candidate_offsets(index, keyword)
+    results = []
+    try:
+        if index.log_size == 0:
+            return results
+        with open(log_file, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if candidates is None:
+                    candidates = []
+                    position = mm.find(b'\n') + 1  # 헤더 무시
+                    while 0 < position < index.log_size:
+                        candidates.append(position)
+                        position = mm.find(b'\n', position) + 1
+                # 같은 시각의 로그가 파일 순서로 남도록 위치 순으로 읽은 뒤 안정 정렬
+                for offset in sorted(candidates):
+                    end = mm.find(b'\n', offset)
+                    row = parse_log_row(mm[offset:end])
+                    # 토큰 포함은 후보일 뿐이므로 실제 메시지로 한 번 더 확인
+                    if row is not None and keyword_lower in row[2].lower():
+                        results.append(row)
+    except Exception as e:
+        print('[오류] 인덱스 검색 중 예외 발생:', e)
+    return sort_logs_desc(results)
+
+
+def print_search_results(keyword, results):
+    """search_keyword()와 같은 형식으로 검색 결과를 출력합니다."""
+    print(f'\n🔍 "{keyword}" 포함 로그:')
+    for log in results:
+        print(f'{log[0]} - {log[2]}')
+    if not results:
+        print('→ 해당 키워드를 포함한 로그가 없습니다.')
+
+
+def is_ascending(values):
+    """값들이 오름차순(같은 값 허용)인지 확인합니다."""
+    return all(map(operator.le, values, islice(values, 1, None)))
+
+
+class ColumnarLogs:
+    """로그를 열(column) 단위로 압축해서 저장하는 클래스입니다.
+
+    행마다 문자열 3개짜리 리스트를 두는 대신 다음처럼 저장합니다.
+    - timestamps: 한 번만 파싱한 epoch 초 (array('q'), 8바이트)
+    - levels: 이벤트 이름을 작은 정수로 바꾼 코드 (array('H'), 2바이트)
+    - messages: 모든 메시지를 이어 붙인 UTF-8 버퍼 하나와 시작 위치 배열 (array('q'))
+
+    정렬과 필터는 열 배열만 보고 인덱스 배열을 만든 뒤 take()로 한 번에 골라냅니다.
+    timestamps가 시간순인지는 sorted_asc에 기록해 두고, 데이터가 바뀔 때(append, take)만 갱신합니다.
+
+    이 모듈은 표준 라이브러리만 사용하므로 정렬/필터는 NumPy처럼 벡터화되어 있지 않습니다.
+    sorted(key=...), map, itertools.compress처럼 C로 구현된 내장 함수로 훑기는 하지만 결국 행마다 처리하므로
+    리스트 버전보다 빠르지 않습니다 (sort_desc는 take()로 메시지를 다시 모으는 만큼 더 느림).
+    이 클래스의 이점은 속도가 아니라 메모리 사용량(행마다 문자열 객체를 두지 않음)입니다.
+    시간 구간 검색만 시간순 로그에서 이진 탐색을 사용합니다.
+    """
+
+    def __init__(self):
+        self.timestamps = array('q')
+        self.sorted_asc = True
+        self.levels = array('H')
+        self.level_names = []
+        self.level_codes = {}
+        self.message_buffer = bytearray()
+        self.message_offsets = array('q', [0])
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    @classmethod
+    def from_logs(cls, logs):
+        """[["timestamp", "event", "message"], ...] 리스트에서 만듭니다."""
+        columns = cls()
+        for log in logs:
+            columns.append(*log)
+        return columns
+
+    @classmethod
+    def from_file(cls, filename):
+        """로그 파일을 한 줄씩 읽어 리스트를 거치지 않고 바로 만듭니다."""
+        columns = cls()
+        try:
+            with open(filename, 'r', encoding='utf-8') as file:
+                next(file)  # 헤더 무시
+                for line in file:
+                    parts = line.strip().split(',')
+                    if len(parts) == 3:
+                        columns.append(*parts)
+        except FileNotFoundError:
+            print('[오류] 파일이 존재하지 않습니다.')
+        except Exception as e:
+            print('[오류] 파일 읽기 중 예외 발생:', e)
+        return columns
+
+    def append(self, timestamp, event, message):
+        """한 행을 추가합니다. 타임스탬프 형식이 잘못된 행은 건너뜁니다."""
+        try:
+            parsed = datetime.strptime(timestamp, TIMESTAMP_FORMAT)
+        except ValueError:
+            return False
+        code = self.level_codes.get(event)
+        if code is None:
+            code = len(self.level_names)
+            self.level_names.append(event)
+            self.level_codes[event] = code
+        epoch = int(parsed.replace(tzinfo=timezone.utc).timestamp())
+        if self.timestamps and epoch < self.timestamps[-1]:
+            self.sorted_asc = False
+        self.timestamps.append(epoch)
+        self.levels.append(code)
+        self.message_buffer += message.encode('utf-8')
+        self.message_offsets.append(len(self.message_buffer))
+        return True
+
+    def get_message(self, i):
+        start, end = self.message_offsets[i], self.message_offsets[i + 1]
+        return self.message_buffer[start:end].decode('utf-8')
+
+    def get_row(self, i):
+        """i번째 행을 기존 형식인 [timestamp, event, message] 리스트로 반환합니다."""
+        timestamp = datetime.fromtimestamp(self.timestamps[i], timezone.utc).strftime(TIMESTAMP_FORMAT)
+        return [timestamp, self.level_names[self.levels[i]], self.get_message(i)]
+
+    def iter_rows(self):
+        """행을 [timestamp, event, message] 리스트로 하나씩 넘겨주는 제너레이터입니다."""
+        for i in range(len(self)):
+            yield self.get_row(i)
+
+    def to_logs(self):
+        """기존 함수들(logs_to_dict 등)에 넘길 수 있도록 리스트 형태로 변환합니다."""
+        return list(self.iter_rows())
+
+    def take(self, indices):
+        """indices 순서대로 행을 골라 새 ColumnarLogs를 만듭니다."""
+        result = ColumnarLogs()
+        result.level_names = list(self.level_names)
+        result.level_codes = dict(self.level_codes)
+        if not isinstance(indices, range):
+            indices = list(indices)  # 열마다 한 번씩 여러 번 훑으므로 iterator는 리스트로 만듦
+        offsets, buffer = self.message_offsets, self.message_buffer
+        result.timestamps = array('q', map(self.timestamps.__getitem__, indices))
+        if self.sorted_asc and isinstance(indices, range) and indices.step == 1:
+            result.sorted_asc = True  # 정렬된 로그의 연속 구간은 그대로 정렬되어 있음
+        else:
+            result.sorted_asc = is_ascending(result.timestamps)
+        result.levels = array('H', map(self.levels.__getitem__, indices))
+        messages = [buffer[offsets[i]:offsets[i + 1]] for i in indices]
+        result.message_buffer = bytearray().join(messages)
+        result.message_offsets = array('q', accumulate(map(len, messages), initial=0))
+        return result
+
+    def argsort_desc(self):
+        """시간 역순 정렬 인덱스를 반환합니다. sort_logs_desc()와 같은 순서(안정 정렬)입니다."""
+        return sorted(range(len(self)), key=self.timestamps.__getitem__, reverse=True)
+
+    def sort_desc(self):
+        return self.take(self.argsort_desc())
+
+    def time_range_indices(self, start, end):
+        """start <= 시각 < end 인 행의 인덱스를 반환합니다.
+
+        Args:
+            start (str): 'YYYY-MM-DD HH:MM:SS' 형식의 시작 시각 (포함)
+            end (str): 'YYYY-MM-DD HH:MM:SS' 형식의 끝 시각 (미포함)
+        """
+        start_epoch = int(datetime.strptime(start, TIMESTAMP_FORMAT).replace(tzinfo=timezone.utc).timestamp())
+        end_epoch = int(datetime.strptime(end, TIMESTAMP_FORMAT).replace(tzinfo=timezone.utc).timestamp())
+        timestamps = self.timestamps
+        if self.sorted_asc:
+            # 시간순으로 정렬된 로그는 이진 탐색으로 구간 양 끝만 찾음
+            return range(bisect_left(timestamps, start_epoch), bisect_left(timestamps, end_epoch))
+        return [i for i, t in enumerate(timestamps) if start_epoch <= t < end_epoch]
+
+    def time_range(self, start, end):
+        return self.take(self.time_range_indices(start, end))
+
+    def level_indices(self, event):
+        """이벤트 이름(예: 'ERROR')이 같은 행의 인덱스를 반환합니다."""
+        code = self.level_codes.get(event)
+        if code is None:
+            return []
+        return list(compress(range(len(self)), map(code.__eq__, self.levels)))
+
+    def filter_level(self, event):
+        return self.take(self.level_indices(event))
+
+
 def main():
     log_file = 'mission_computer_main.log'
     json_file = 'mission_computer_main.json'
 
-    logs = read_log_file(log_file)
-    if not logs:
+    # 행마다 문자열 리스트를 두지 않고 열 단위로 읽어서 메모리를 아낌
+    # (시각을 해석할 수 없는 행은 시간순 정렬을 할 수 없으므로 제외됨)
+    logs = ColumnarLogs.from_file(log_file)
+    if not len(logs):
         return
 
     print('\n[1] 읽은 로그:')
-    for log in logs:
+    for log in logs.iter_rows():
         print(log)
 
-    logs = sort_logs_desc(logs)
+    logs = logs.sort_desc()
 
     print('\n[2] 정렬된 로그:')
-    for log in logs:
+    for log in logs.iter_rows():
         print(log)
 
-    log_dict = logs_to_dict(logs)
-
-    save_json(log_dict, json_file)
+    save_json_stream(logs.iter_rows(), json_file)
     print(f'\n[3] JSON 파일로 저장 완료 → {json_file}')
 
+    index = build_log_index(log_file)
+
     keyword = input('\n[4] 검색할 키워드를 입력하세요: ')
-    search_keyword(logs, keyword)
+    print_search_results(keyword, search_keyword_indexed(log_file, index, keyword))
 
 
 if __name__ == '__main__':